@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, List, Tuple
 
+import numpy as np
+
 
 @dataclass
 class CountEvent:
@@ -47,6 +49,58 @@ def side_of_line(
     return 0
 
 
+def side_of_points(
+    points: np.ndarray, line: Tuple[float, float, float, float], eps: float = 0.0
+) -> np.ndarray:
+    """Return which side of ``line`` each of many points lies on.
+
+    Parameters
+    ----------
+    points:
+        Array of shape ``(N, 2)`` holding ``(x, y)`` points.
+    line:
+        Line represented as ``(x1, y1, x2, y2)``.
+    eps:
+        Points whose absolute cross product is below ``eps`` count as lying
+        on the line.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``int8`` array of length ``N`` with the same ``-1``/``0``/``1``
+        convention as :func:`side_of_line`.
+    """
+
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    x1, y1, x2, y2 = line
+    val = (x2 - x1) * (pts[:, 1] - y1) - (y2 - y1) * (pts[:, 0] - x1)
+    sides = np.sign(val).astype(np.int8)
+    if eps:
+        sides[np.abs(val) < eps] = 0
+    return sides
+
+
+def side_of_line_batch(bboxes: np.ndarray, line: Tuple[float, float, float, float]) -> np.ndarray:
+    """Vectorised :func:`side_of_line` for many boxes at once.
+
+    Parameters
+    ----------
+    bboxes:
+        Array of shape ``(N, 4)`` holding ``(x1, y1, x2, y2)`` boxes.
+    line:
+        Line represented as ``(x1, y1, x2, y2)``.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``int8`` array of length ``N`` as returned by :func:`side_of_points`
+        for the box centres.
+    """
+
+    boxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+    return side_of_points((boxes[:, :2] + boxes[:, 2:]) / 2.0, line)
+
+
 def cross_events(prev_side: int | None, new_side: int) -> List[str]:
     """Return crossing events from ``prev_side`` to ``new_side``.
 
@@ -80,8 +134,10 @@ def count_update(
     line_state = {tid: info.copy() for tid, info in state.get(line_id, {}).items()}
     events: List[CountEvent] = []
 
-    for tid, tr in tracks.items():
-        side = side_of_line(tr["bbox"], line)
+    # side of every track centre in one pass over an (N, 4) box array
+    sides = side_of_line_batch([tr["bbox"] for tr in tracks.values()], line).tolist()
+
+    for (tid, tr), side in zip(tracks.items(), sides):
         info = line_state.get(tid, {"last_side": side, "counted": False})
         prev_side = info.get("last_side")  # type: ignore[assignment]
         counted = bool(info.get("counted"))
@@ -107,6 +163,8 @@ def count_update(
 __all__ = [
     "CountEvent",
     "side_of_line",
+    "side_of_line_batch",
+    "side_of_points",
     "cross_events",
     "count_update",
 ]
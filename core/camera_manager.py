@@ -85,11 +85,12 @@ class CameraManager:
         return None
 
     def _build_flags(self, cam: dict) -> dict:
+        tasks = cam.get("tasks", [])
         return {
             "enabled": cam.get("enabled", True),
             "ppe": cam.get("ppe", False),
             "vms": cam.get("visitor_mgmt", False),
-            "counting": any(t in cam.get("tasks", []) for t in ("in_count", "out_count")),
+            "counting": "in_count" in tasks or "out_count" in tasks,
         }
 
     async def _start_tracker_background(self, cam: dict) -> None:
@@ -175,10 +176,14 @@ class CameraManager:
 
     async def _update_latest(self, cam_id: int, frame: np.ndarray) -> None:
         async with self._latest_lock:
-            self._latest_frames[cam_id] = {"ts": mtime(), "bgr": frame.copy()}
+            self._latest_frames[cam_id] = {"ts": mtime(), "bgr": frame}
 
     def update_latest_frame(self, cam_id: int, frame: np.ndarray) -> None:
-        """Schedule update of cached frame for ``cam_id``."""
+        """Schedule update of cached frame for ``cam_id``.
+
+        The cache keeps a reference to ``frame``; callers hand over a frame
+        they no longer mutate.
+        """
         asyncio.run_coroutine_threadsafe(self._update_latest(cam_id, frame), self._loop)
 
     async def snapshot(self, cam_id: int, timeout: float = 0.8):
@@ -186,7 +191,8 @@ class CameraManager:
 
         Returns ``(ok, frame, detail)`` where ``frame`` is a BGR ndarray or
         ``None`` when unavailable. ``detail`` indicates whether the frame was
-        served from the cache or via a probe capture.
+        served from the cache or via a probe capture. Cached frames are shared
+        with other callers and must be treated as read-only.
         """
 
         now = mtime()
@@ -195,7 +201,7 @@ class CameraManager:
             if info and (now - float(info.get("ts", 0.0)) <= 2.0):
                 bgr = info.get("bgr")
                 if isinstance(bgr, np.ndarray):
-                    return True, self._cap_frame(bgr.copy()), "from_cache"
+                    return True, self._cap_frame(bgr), "from_cache"
 
         cam = self._find_cam(cam_id)
         url = cam.get("url", "") if cam else ""
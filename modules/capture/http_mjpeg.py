@@ -2,15 +2,14 @@ from __future__ import annotations
 
 """HTTP MJPEG frame source."""
 
-import io
 import logging
 import queue
 import threading
 
 import numpy as np
 import requests
-from PIL import Image
 
+from utils.jpeg import decode_jpeg
 from utils.logging import log_capture_event
 from utils.logx import log_throttled
 
@@ -94,9 +93,7 @@ class HttpMjpegSource(IFrameSource):
         except queue.Empty:
             log_capture_event(self.cam_id, "read_timeout", backend="http")
             raise FrameSourceError("READ_TIMEOUT")
-        img = Image.open(io.BytesIO(jpg)).convert("RGB")
-        arr = np.array(img)[:, :, ::-1]
-        return arr
+        return decode_jpeg(jpg)
 
     def info(self) -> dict[str, int | float]:
         return {}
@@ -13,6 +13,7 @@ probed with ``ffprobe`` when not specified explicitly.
 import logging
 import os
 import queue
+import selectors
 import shlex
 import subprocess
 import threading
@@ -34,14 +35,96 @@ logger = logging.getLogger(__name__)
 
 MAX_SHORT_READS = 3
 MAX_RESTART_ATTEMPTS = 5
+# Seconds without any stdout data before a frame read is treated as short.
+STALL_TIMEOUT = 10.0
+
+
+class _StderrPump:
+    """Drain ``ffmpeg`` stderr pipes for every source from one thread.
+
+    Registered pipes are switched to non-blocking mode and serviced by a
+    shared selector; complete lines are masked and appended to the owning
+    source's buffer. The thread exits once no pipes remain and is restarted by
+    the next registration.
+    """
+
+    def __init__(self) -> None:
+        self._sel = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def register(self, stream, buffer: deque[str]) -> bool:
+        """Drain *stream* into *buffer*; return ``False`` if it has no fd."""
+        try:
+            fd = stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            return False
+        os.set_blocking(fd, False)
+        with self._lock:
+            self._sel.register(stream, selectors.EVENT_READ, (buffer, bytearray()))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="ffmpeg-stderr", daemon=True
+                )
+                self._thread.start()
+        return True
+
+    def unregister(self, stream) -> None:
+        """Stop draining *stream*; call before closing it."""
+        with self._lock:
+            try:
+                self._sel.unregister(stream)
+            except (KeyError, ValueError):
+                pass
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._sel.get_map():
+                    self._thread = None
+                    return
+            try:
+                events = self._sel.select(timeout=1.0)
+            except (OSError, ValueError):
+                time.sleep(0.1)
+                continue
+            with self._lock:
+                for key, _ in events:
+                    if key.fileobj not in self._sel.get_map():
+                        continue  # unregistered while we were waiting
+                    self._pump(key)
+
+    def _pump(self, key: selectors.SelectorKey) -> None:
+        try:
+            chunk = os.read(key.fd, 65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            chunk = b""
+        buffer, partial = key.data
+        if chunk:
+            partial += chunk
+            *lines, rest = partial.split(b"\n")
+            partial[:] = rest
+        else:
+            self._sel.unregister(key.fileobj)
+            lines = [partial] if partial else []
+        for line in lines:
+            buffer.append(mask_credentials(line.decode("utf-8", "replace").rstrip()))
+
+
+_STDERR_PUMP = _StderrPump()
 
 
 class RtspFfmpegSource(IFrameSource):
     """Capture frames from an RTSP stream using FFmpeg.
 
-    Frames are read on a background thread into a preallocated buffer. Complete
-    frames are pushed into a two-element queue, dropping the oldest when full.
-    Consecutive short reads trigger FFmpeg restarts with exponential backoff.
+    Frames are read on a background thread into a preallocated buffer. The
+    thread waits on stdout readiness with :mod:`selectors` so a stalled FFmpeg
+    never blocks it indefinitely. Complete frames are pushed into a
+    two-element queue, dropping the oldest when full. Consecutive short reads
+    trigger FFmpeg restarts with exponential backoff. Stderr is drained by a
+    selector thread shared by all sources rather than one thread per camera.
     """
 
     def __init__(
@@ -91,6 +174,7 @@ class RtspFfmpegSource(IFrameSource):
         self._frame_queue: queue.Queue[np.ndarray] | None = None
         self._reader_thread: threading.Thread | None = None
         self._stop_event: threading.Event | None = None
+        self._stdout_sel: selectors.BaseSelector | None = None
         self._short_reads = 0
         base = getenv_num("RECONNECT_BACKOFF_MS_MIN", 500, int) / 1000
         max_b = getenv_num("RECONNECT_BACKOFF_MS_MAX", 2000, int) / 1000
@@ -191,11 +275,12 @@ class RtspFfmpegSource(IFrameSource):
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                bufsize=10**7,
+                bufsize=0,
             )
             self._stderr_buffer.clear()
-            self._stderr_thread = threading.Thread(target=self._drain_stderr, daemon=True)
-            self._stderr_thread.start()
+            if not _STDERR_PUMP.register(self.proc.stderr, self._stderr_buffer):
+                self._stderr_thread = threading.Thread(target=self._drain_stderr, daemon=True)
+                self._stderr_thread.start()
             log_capture_event(self.cam_id, "opened", backend="ffmpeg", uri=self.uri)
             self._short_reads = 0
 
@@ -244,7 +329,7 @@ class RtspFfmpegSource(IFrameSource):
                     break
                 continue
             try:
-                read = self.proc.stdout.readinto(mv)
+                read = self._read_frame(self.proc.stdout, mv)
             except (EOFError, BrokenPipeError):
                 try:
                     self._restart_proc()
@@ -253,6 +338,8 @@ class RtspFfmpegSource(IFrameSource):
                 continue
             except Exception:
                 read = 0
+            if self._stop_event.is_set():
+                break
             if read != expected:
                 self._short_reads += 1
                 if self._short_reads >= MAX_SHORT_READS:
@@ -277,6 +364,52 @@ class RtspFfmpegSource(IFrameSource):
                     pass
             self.last_frame_ts = time.time()
 
+    def _read_frame(self, stdout, mv: memoryview) -> int:
+        """Fill ``mv`` from ``stdout`` and return the number of bytes read.
+
+        Reads are gated on pipe readiness so partial frames are assembled as
+        soon as data arrives and the stop event is honoured while FFmpeg is
+        silent. Fewer bytes than ``len(mv)`` are returned on EOF, stop, or
+        after :data:`STALL_TIMEOUT` seconds without data.
+        """
+        try:
+            stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            return stdout.readinto(mv) or 0
+        sel = self._stdout_selector(stdout)
+        total = len(mv)
+        got = 0
+        deadline = time.monotonic() + STALL_TIMEOUT
+        while got < total:
+            if self._stop_event and self._stop_event.is_set():
+                break
+            if not sel.select(timeout=min(1.0, max(deadline - time.monotonic(), 0))):
+                if time.monotonic() >= deadline:
+                    break
+                continue
+            n = stdout.readinto(mv[got:])
+            if not n:
+                break
+            got += n
+            deadline = time.monotonic() + STALL_TIMEOUT
+        return got
+
+    def _stdout_selector(self, stdout) -> selectors.BaseSelector:
+        """Return the reader's selector with only ``stdout`` registered.
+
+        The selector lives as long as the source; a restart swaps the
+        registered pipe instead of building a new selector for every frame.
+        """
+        sel = self._stdout_sel
+        if sel is None:
+            sel = self._stdout_sel = selectors.DefaultSelector()
+        for key in list(sel.get_map().values()):
+            if key.fileobj is not stdout:
+                sel.unregister(key.fileobj)
+        if not sel.get_map():
+            sel.register(stdout, selectors.EVENT_READ)
+        return sel
+
     def _restart_proc(self) -> None:
         self._log_stderr()
         stderr = mask_credentials(self.last_stderr)
@@ -336,6 +469,9 @@ class RtspFfmpegSource(IFrameSource):
             self._reader_thread.join(timeout=1)
         self._reader_thread = None
         self._stop_proc()
+        if self._stdout_sel:
+            self._stdout_sel.close()
+            self._stdout_sel = None
         if self._frame_queue:
             while not self._frame_queue.empty():
                 try:
@@ -364,6 +500,8 @@ class RtspFfmpegSource(IFrameSource):
         if proc.stdout:
             proc.stdout.close()
         stderr = proc.stderr
+        if stderr:
+            _STDERR_PUMP.unregister(stderr)
         if stderr_thread and stderr_thread.is_alive():
             stderr_thread.join(timeout=1)
         if stderr:
@@ -376,6 +514,8 @@ class RtspFfmpegSource(IFrameSource):
     def _drain_stderr(self) -> None:
         """Drain stderr from ``ffmpeg`` into the internal buffer.
 
+        Only used when stderr has no file descriptor for the shared pump.
+
         The subprocess handle is captured at thread start to avoid races where
         ``self.proc`` is cleared by :meth:`_stop_proc` before the thread runs.
         Without this, the background thread may attempt to access
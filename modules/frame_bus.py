@@ -1,10 +1,9 @@
-"""Thread-safe ring buffer for camera frames."""
+"""Thread-safe latest-frame slot for camera frames."""
 
 from __future__ import annotations
 
 import threading
 import time
-from collections import deque
 from dataclasses import dataclass
 from typing import Optional
 
@@ -21,27 +20,32 @@ class FrameInfo:
 
 
 class FrameBus:
-    """Ring buffer holding at most two frames.
+    """Single slot holding the most recent frame.
 
-    The buffer keeps only the most recent frames to minimise latency. ``put``
-    drops the oldest frame when the capacity is exceeded. ``get_latest`` waits
-    up to ``timeout_ms`` for a frame and returns ``None`` on timeout.
+    Only the newest frame is kept to minimise latency; ``put`` replaces the
+    previous one. ``get_latest`` waits up to ``timeout_ms`` for a frame and
+    returns ``None`` on timeout.
+
+    Frames are shared with every reader without copying, so producers must not
+    reuse a buffer after ``put`` and readers must treat frames as read-only.
     """
 
     def __init__(self) -> None:
-        self._buf: deque[np.ndarray] = deque(maxlen=2)
+        self._latest: Optional[np.ndarray] = None
         self._lock = threading.Lock()
         self._cond = threading.Condition(self._lock)
         self._info = FrameInfo()
         self._last_ts: Optional[float] = None
+        self._seq = 0
 
     # ------------------------------------------------------------------
     def put(self, frame: np.ndarray) -> None:
-        """Insert ``frame`` into the buffer, dropping older ones."""
+        """Publish ``frame``, replacing the previous one."""
         if frame is None:
             return
         with self._cond:
-            self._buf.append(frame)
+            self._latest = frame
+            self._seq += 1
             h, w = frame.shape[:2]
             if self._info.w != w or self._info.h != h:
                 self._info.w, self._info.h = w, h
@@ -58,12 +62,29 @@ class FrameBus:
         """Return the newest frame or ``None`` if none arrives in time."""
         deadline = time.time() + timeout_ms / 1000.0
         with self._cond:
-            while not self._buf:
+            while self._latest is None:
                 remaining = deadline - time.time()
                 if remaining <= 0:
                     return None
                 self._cond.wait(remaining)
-            return self._buf[-1].copy()
+            return self._latest
+
+    # ------------------------------------------------------------------
+    def get_newer(self, seq: int, timeout_ms: int) -> tuple[int, Optional[np.ndarray]]:
+        """Return ``(seq, frame)`` for the newest frame published after ``seq``.
+
+        Readers pass back the sequence number they last received so they block
+        until a new frame arrives instead of re-reading the same one. Returns
+        ``(seq, None)`` on timeout.
+        """
+        deadline = time.time() + timeout_ms / 1000.0
+        with self._cond:
+            while self._seq == seq:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return seq, None
+                self._cond.wait(remaining)
+            return self._seq, self._latest
 
     # ------------------------------------------------------------------
     def info(self) -> FrameInfo:
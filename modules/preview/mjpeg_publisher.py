@@ -1,13 +1,30 @@
 from __future__ import annotations
 
 import asyncio
+import os
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import AsyncIterator, Dict
 
 from modules.frame_bus import FrameBus
-from utils.jpeg import encode_jpeg
+from utils.jpeg import encode_jpeg, mjpeg_part
 from utils import logx
 
+# JPEG encoding runs on a small dedicated pool so it never blocks the event
+# loop; libjpeg-turbo releases the GIL, letting two workers encode in parallel.
+_ENCODER = ThreadPoolExecutor(
+    max_workers=max(1, min(2, (os.cpu_count() or 2) // 2)),
+    thread_name_prefix="preview-jpeg",
+)
+
+
+def _encode_part(frame) -> bytes:
+    return mjpeg_part(encode_jpeg(frame))
+
+
+def _failed(fut: asyncio.Future[bytes]) -> bool:
+    return fut.done() and (fut.cancelled() or fut.exception() is not None)
+
 
 class PreviewPublisher:
     """Publish MJPEG frames from :class:`FrameBus` instances."""
@@ -16,6 +33,8 @@ class PreviewPublisher:
         self._buses: Dict[int, FrameBus] = buses or {}
         self._showing: set[int] = set()
         self._clients: defaultdict[int, int] = defaultdict(int)
+        # latest (frame seq, pending framed JPEG) per camera, shared by all clients
+        self._parts: Dict[int, tuple[int, asyncio.Future[bytes]]] = {}
 
     # ------------------------------------------------------------------
     def start_show(self, camera_id: int) -> None:
@@ -42,14 +61,28 @@ class PreviewPublisher:
             return
         self._clients[camera_id] += 1
         logx.event("PREVIEW_CLIENT_OPEN", camera_id=camera_id)
-        boundary = b"--frame\r\nContent-Type: image/jpeg\r\n\r\n"
+        seq = 0
         try:
             while self.is_showing(camera_id):
-                frame = await asyncio.to_thread(bus.get_latest, 1000)
+                seq, frame = await asyncio.to_thread(bus.get_newer, seq, 1000)
                 if frame is None:
                     continue
-                jpeg = encode_jpeg(frame)
-                yield boundary + jpeg + b"\r\n"
+                cached = self._parts.get(camera_id)
+                if not cached or cached[0] != seq or _failed(cached[1]):
+                    loop = asyncio.get_running_loop()
+                    cached = (seq, loop.run_in_executor(_ENCODER, _encode_part, frame))
+                    self._parts[camera_id] = cached
+                try:
+                    # shielded so a disconnecting viewer cannot cancel the
+                    # encode every other viewer of this camera is waiting on
+                    part = await asyncio.shield(cached[1])
+                except Exception:
+                    if self._parts.get(camera_id) is cached:
+                        del self._parts[camera_id]
+                    raise
+                yield part
         finally:
             self._clients[camera_id] -= 1
+            if not self._clients[camera_id]:
+                self._parts.pop(camera_id, None)
             logx.event("PREVIEW_CLIENT_CLOSE", camera_id=camera_id)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import os
 import queue
 import select
 import subprocess
@@ -28,10 +27,13 @@ class RtspConnector:
     ERROR = "error"
     RETRYING = "retrying"
 
-    def __init__(self, url: str, width: int, height: int, fps: float = 30.0) -> None:
+    def __init__(
+        self, url: str, width: int, height: int, fps: float = 30.0, hwaccel: bool = False
+    ) -> None:
         self.url = url
         self.width = width
         self.height = height
+        self.hwaccel = hwaccel
         self.frame_size = width * height * 3
         self.expected_interval = 1.0 / fps if fps > 0 else 0.033
         self.state = self.STOPPED
@@ -78,6 +80,32 @@ class RtspConnector:
             "subscribers": len(self._subs),
         }
 
+    # ------------------------------------------------------------------
+    def _build_cmd(self) -> List[str]:
+        cmd = [
+            "ffmpeg",
+            "-rtsp_transport",
+            "tcp",
+            "-fflags",
+            "nobuffer",
+            "-flags",
+            "low_delay",
+        ]
+        if self.hwaccel:
+            cmd += ["-hwaccel", "auto"]
+        cmd += [
+            "-i",
+            self.url,
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "bgr24",
+            "-vf",
+            f"scale={self.width}:{self.height}:flags=fast_bilinear",
+            "pipe:1",
+        ]
+        return cmd
+
     # ------------------------------------------------------------------
     def _run(self) -> None:
         backoff = 1
@@ -86,24 +114,7 @@ class RtspConnector:
             self.state = self.CONNECTING
             try:
                 self._proc = subprocess.Popen(
-                    [
-                        "ffmpeg",
-                        "-rtsp_transport",
-                        "tcp",
-                        "-fflags",
-                        "nobuffer",
-                        "-flags",
-                        "low_delay",
-                        "-i",
-                        self.url,
-                        "-f",
-                        "rawvideo",
-                        "-pix_fmt",
-                        "bgr24",
-                        "-vf",
-                        f"scale={self.width}:{self.height}",
-                        "pipe:1",
-                    ],
+                    self._build_cmd(),
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
                     bufsize=0,
@@ -129,14 +140,14 @@ class RtspConnector:
                         self._proc.kill()
                         break
                     continue
-                data = os.read(self._proc.stdout.fileno(), self.frame_size)
-                if len(data) != self.frame_size:
+                frame = np.empty((self.height, self.width, 3), dtype=np.uint8)
+                if self._read_frame(self._proc.stdout, frame, timeout) != self.frame_size:
                     self.last_error = "short read"
                     self.state = self.ERROR
                     logx.error("STREAM_ERROR", url=self.url, error=self.last_error)
                     self._proc.kill()
                     break
-                frame = np.frombuffer(data, dtype=np.uint8).reshape(self.height, self.width, 3)
+                frame.flags.writeable = False
                 if self.state != self.CONNECTED:
                     self.state = self.CONNECTED
                     logx.event("STREAM_CONNECTED", url=self.url)
@@ -162,6 +173,28 @@ class RtspConnector:
             backoff = min(backoff * 2, 10)
         self._cleanup_proc()
 
+    @staticmethod
+    def _read_frame(stdout, frame: np.ndarray, timeout: float) -> int:
+        """Read one raw frame from ``stdout`` directly into ``frame``.
+
+        Pipes often deliver a frame in several chunks, so partial reads are
+        completed until the frame is full, EOF is reached or no more data
+        arrives within ``timeout`` seconds. Returns the number of bytes read.
+        """
+        mv = memoryview(frame).cast("B")
+        size = len(mv)
+        got = 0
+        while got < size:
+            if got:
+                ready, _, _ = select.select([stdout], [], [], timeout)
+                if not ready:
+                    break
+            n = stdout.readinto(mv[got:])
+            if not n:
+                break
+            got += n
+        return got
+
     def _cleanup_proc(self) -> None:
         if self._proc:
             try:
@@ -6,6 +6,7 @@ from os import getenv
 from typing import Any, List, Tuple
 
 import numpy as np
+from loguru import logger
 
 try:  # optional heavy dependency
     import torch  # type: ignore
@@ -42,6 +43,18 @@ class Detector:
     def __init__(self, model: Any, device: Any) -> None:
         self.model = model
         self.device = device
+        # The registry halves CUDA weights; predict must be told too or
+        # Ultralytics casts the model back to FP32 for every call.
+        device_type = str(getattr(device, "type", device) or "")
+        self.predict_kwargs: dict[str, Any] = {
+            "half": device_type.startswith("cuda") and getenv("VMS26_FP16", "auto") in ("auto", "1")
+        }
+        imgsz = getenv("VMS26_IMGSZ")
+        if imgsz:
+            try:
+                self.predict_kwargs["imgsz"] = int(imgsz)
+            except ValueError:
+                logger.warning("invalid VMS26_IMGSZ {!r}; using the model default", imgsz)
         # Record model/backend info for diagnostics
         try:
             if get_sync_client is not None:
@@ -65,6 +78,7 @@ class Detector:
             verbose=False,
             conf=conf_thres,
             iou=iou_thres,
+            **self.predict_kwargs,
         )[0]
         boxes = results.boxes.data
         if hasattr(boxes, "tolist"):
@@ -119,8 +133,10 @@ class Detector:
             verbose=False,
             conf=conf_thres,
             iou=iou_thres,
+            **self.predict_kwargs,
         )
         batch: List[List[Tuple[tuple, float, str]]] = []
+        label_groups = None
         for res in results:
             boxes = res.boxes.data
             if hasattr(boxes, "tolist"):
@@ -135,8 +151,12 @@ class Detector:
                 cls_idx = (
                     boxes[:, 5].long().cpu().numpy() if tensor_mode else boxes[:, 5].astype(int)
                 )
-                names = [self.model.names[i] for i in range(len(self.model.names))]
-                label_groups = np.array([resolve_group(n, groups) for n in names], dtype=object)
+                if label_groups is None:
+                    # class -> group lookup is identical for every frame in the batch
+                    names = [self.model.names[i] for i in range(len(self.model.names))]
+                    label_groups = np.array(
+                        [resolve_group(n, groups) for n in names], dtype=object
+                    )
                 groups_arr = label_groups[cls_idx]
                 mask = groups_arr != None
                 if mask.any():
@@ -23,12 +23,14 @@ from loguru import logger
 from redis.exceptions import RedisError
 
 from app.core.perf import PERF
-from app.core.redis_guard import ensure_ttl, wrap_pipeline
+from app.core.redis_guard import wrap_pipeline
+from app.vision.counting import side_of_points
 from config import ANOMALY_ITEMS, config
 from modules.profiler import register_thread
 from utils import logx
 from utils.gpu import get_device
 from utils.redis import EVENTS_STREAM, get_sync_client, xadd_event
+from utils.spsc import SPSCRing
 from utils.time import format_ts
 from utils.url import get_stream_type
 
@@ -82,29 +84,6 @@ def group_of(cls: str) -> str:
     return "other"
 
 
-def side(
-    point: tuple[float, float],
-    a: tuple[float, float],
-    b: tuple[float, float],
-    eps: float = 2.0,
-) -> int:
-    """Return which side of ``ab`` the ``point`` lies on.
-
-    Uses the sign of the 2D cross product. ``1`` indicates the point is to the
-    left of the directed line from ``a`` to ``b``; ``-1`` indicates the right
-    side. ``0`` is returned when the absolute cross product is below ``eps``,
-    treating the point as on the line.
-    """
-
-    ax, ay = a
-    bx, by = b
-    px, py = point
-    cross = (bx - ax) * (py - ay) - (by - ay) * (px - ax)
-    if abs(cross) < eps:
-        return 0
-    return 1 if cross > 0 else -1
-
-
 def point_line_distance(
     point: tuple[float, float],
     a: tuple[float, float],
@@ -230,31 +209,30 @@ def process_frame(tracker: "PersonTracker", frame: np.ndarray, detections: list[
         tracker.last_frame_shape = (h, w)
         line_pos = int((h if tracker.line_orientation == "horizontal" else w) * tracker.line_ratio)
         now = time.time()
-        for trk in ds_tracks:
-            if not trk.is_confirmed():
-                continue
+        if tracker.line_orientation == "horizontal":
+            line_start = (0.0, float(line_pos))
+            line_end = (float(w - 1), float(line_pos))
+        else:
+            line_start = (float(line_pos), 0.0)
+            line_end = (float(line_pos), float(h - 1))
+        # undo letterboxing and classify sides for all confirmed tracks in one
+        # pass; the loop below only handles per-track state and side effects
+        confirmed = [trk for trk in ds_tracks if trk.is_confirmed()]
+        scale = getattr(tracker, "scale", 1.0)
+        pad_x = getattr(tracker, "pad_x", 0)
+        pad_y = getattr(tracker, "pad_y", 0)
+        raw = np.asarray([trk.to_ltrb() for trk in confirmed], dtype=float).reshape(-1, 4)
+        boxes = np.trunc((raw - (pad_x, pad_y, pad_x, pad_y)) / scale).astype(int)
+        centers = (boxes[:, :2] + boxes[:, 2:]) // 2
+        sides = side_of_points(
+            centers, (*line_start, *line_end), getattr(tracker, "side_eps", 2.0)
+        )
+        state_dirty = False
+        for trk, (left, top, right, bottom), (cx, cy), cur_side_sign in zip(
+            confirmed, boxes.tolist(), centers.tolist(), sides.tolist()
+        ):
             tid = trk.track_id
-            l_raw, t_raw, r_raw, b_raw = trk.to_ltrb()
-            scale = getattr(tracker, "scale", 1.0)
-            pad_x = getattr(tracker, "pad_x", 0)
-            pad_y = getattr(tracker, "pad_y", 0)
-            left = int((l_raw - pad_x) / scale)
-            top = int((t_raw - pad_y) / scale)
-            right = int((r_raw - pad_x) / scale)
-            bottom = int((b_raw - pad_y) / scale)
-            cx = (left + right) // 2
-            cy = (top + bottom) // 2
-            if tracker.line_orientation == "horizontal":
-                line_start = (0.0, float(line_pos))
-                line_end = (float(w - 1), float(line_pos))
-            else:
-                line_start = (float(line_pos), 0.0)
-                line_end = (float(line_pos), float(h - 1))
             prev = tracker.tracks.get(tid, {})
-            raw_side = side((cx, cy), line_start, line_end, getattr(tracker, "side_eps", 2.0))
-            cur_side_sign = raw_side
-            prev_side_sign = prev.get("last_side")
-
             if tracker.line_orientation == "horizontal":
                 zone = (
                     "top"
@@ -344,25 +322,29 @@ def process_frame(tracker: "PersonTracker", frame: np.ndarray, detections: list[
                             "track_id": tid,
                             "line_id": 0,
                         }
-
-                    try:
-                        key = f"cam:{tracker.cam_id}:state"
-                        pipe = tracker.redis.pipeline()
-                        pipe.hset(
-                            key,
-                            mapping={
-                                "fps_in": tracker.debug_stats.get("capture_fps", 0.0),
-                                "fps_out": tracker.debug_stats.get("process_fps", 0.0),
-                                "last_error": tracker.stream_error,
-                            },
-                        )
-                        ensure_ttl(tracker.redis, key, 15)
-                    except Exception:
-                        logger.exception("failed to update cam state")
+                    state_dirty = True
             state["last_side"] = cur_side_sign
             state["last_seen"] = now
             state_lines[0] = state
             tracker.track_states[tid] = state_lines
+        if state_dirty:
+            # one round trip per frame, however many tracks were evaluated
+            key = f"cam:{tracker.cam_id}:state"
+            mapping = {
+                "fps_in": tracker.debug_stats.get("capture_fps", 0.0),
+                "fps_out": tracker.debug_stats.get("process_fps", 0.0),
+                "last_error": tracker.stream_error,
+            }
+            try:
+                wrap_pipeline(
+                    tracker.redis,
+                    [
+                        lambda p: p.hset(key, mapping=mapping),
+                        lambda p: p.expire(key, 15),
+                    ],
+                )
+            except Exception:
+                logger.exception("failed to update cam state")
         now = time.time()
         cutoff = now - tracker.track_state_ttl
         for t_id in list(tracker.track_states.keys()):
@@ -390,7 +372,8 @@ def process_frame(tracker: "PersonTracker", frame: np.ndarray, detections: list[
             "show_counts",
         )
     }
-    processed = frame.copy() if any(debug_flags.values()) else frame
+    # nothing draws on the frame here, so share it instead of copying per tick
+    processed = frame
     if any(debug_flags.values()):
         counts = {
             k: int(v)
@@ -726,9 +709,9 @@ class PersonTracker:
         self.detector = Detector(self.model_person, self.device)
         self.batch_size = max(2, min(int(cfg.get("batch_size", 2)), 4))
         qsize = cfg.get("queue_size", 10)
-        self.frame_queue = queue.Queue(maxsize=qsize)
-        self.det_queue = queue.Queue(maxsize=qsize)
-        self.out_queue = queue.Queue(maxsize=qsize)
+        self.frame_queue = SPSCRing(maxsize=qsize)
+        self.det_queue = SPSCRing(maxsize=qsize)
+        self.out_queue = SPSCRing(maxsize=qsize)
         log_mem("Before loading plate model")
         try:
             start = time.perf_counter()
@@ -39,12 +39,21 @@ class VisitorDB:
             return {}
         return self._decode_map(data) if data else {}
 
-    def _update_name_index(self, name: str, phone: str) -> None:
-        if not name:
-            return
-        member = f"{name.lower()}|{phone}"
-        ts = time.time()
-        self.client.zadd("visitor_name_idx", {member: ts})
+    def _write_record(self, phone: str, mapping: Dict[str, str], name: str = "") -> None:
+        """Store ``mapping`` and index ``name`` in a single round trip.
+
+        The record write must succeed; the name index is best-effort, so a
+        failed ``ZADD`` is logged instead of raised.
+        """
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hset(f"visitor:record:{phone}", mapping=mapping)
+        if name:
+            pipe.zadd("visitor_name_idx", {f"{name.lower()}|{phone}": time.time()})
+        results = pipe.execute(raise_on_error=False)
+        if isinstance(results[0], Exception):
+            raise results[0]
+        if name and isinstance(results[1], Exception):
+            logger.warning("failed to index visitor {}: {}", phone, results[1])
 
     def _iter_name_index(self, prefix_l: str, seen: set[tuple[str, str]]) -> Iterator[dict]:
         pattern = f"{prefix_l}*"
@@ -124,11 +133,7 @@ class VisitorDB:
                 "org": org,
                 "photo": photo,
             }
-            self.client.hset(f"visitor:record:{phone}", mapping=mapping)
-            try:
-                self._update_name_index(name, phone)
-            except Exception:
-                pass
+            self._write_record(phone, mapping, name)
             return vid
         except Exception as exc:
             logger.exception("failed to save visitor {}: {}", phone, exc)
@@ -170,11 +175,7 @@ class VisitorDB:
             "org": org,
             "photo": photo,
         }
-        self.client.hset(f"visitor:record:{phone}", mapping=mapping)
-        try:
-            self._update_name_index(name, phone)
-        except Exception:
-            pass
+        self._write_record(phone, mapping, name)
         return vid
 
     def get_visitor_by_phone(self, phone: str) -> Optional[Dict[str, str]]:
@@ -11,6 +11,7 @@ from config import DEFAULT_MODULES
 from config.storage import save_config
 from modules.utils import hash_password, require_admin
 from schemas.user import UserCreate, UserUpdate
+from utils.templates import get_templates
 
 # Default roles for user accounts
 DEFAULT_ROLES = ["admin", "viewer"]
@@ -52,8 +53,7 @@ def init_context(
     cfg = config
     redis = redis_client
     redisfx = redis_facade
-    templates = Jinja2Templates(directory=templates_path)
-    templates.env.add_extension("jinja2.ext.do")
+    templates = get_templates(templates_path)
     cfg_path = config_path
 
 
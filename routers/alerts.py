@@ -8,7 +8,6 @@ from typing import Dict
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from fastapi_csrf_protect import CsrfProtect
 from loguru import logger
 from pydantic import ValidationError
@@ -20,6 +19,7 @@ from core import events
 from modules.utils import require_roles
 from schemas.alerts import AlertRule
 from utils.deps import get_redis
+from utils.templates import get_templates
 
 router = APIRouter()
 cfg: dict = {}
@@ -61,8 +61,7 @@ def init_context(
     trackers_map = trackers
     redis = redis_client
     redisfx = redis_facade
-    templates = Jinja2Templates(directory=templates_path)
-    templates.env.add_extension("jinja2.ext.do")
+    templates = get_templates(templates_path)
     cfg_path = config_path
 
 
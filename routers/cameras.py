@@ -12,6 +12,7 @@ import subprocess
 import time
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List
 from urllib.parse import urlparse, urlsplit
 
@@ -22,7 +23,6 @@ except Exception:  # pragma: no cover - dependency may be missing
 import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import JSONResponse, RedirectResponse, Response, StreamingResponse
-from fastapi.templating import Jinja2Templates
 from loguru import logger
 from pydantic import BaseModel, Field, ValidationError, field_validator
 from starlette.requests import ClientDisconnect
@@ -58,6 +58,7 @@ from utils.ffmpeg import build_snapshot_cmd
 from utils.ffmpeg_snapshot import capture_snapshot
 from utils.jpeg import encode_jpeg
 from utils.logx import log_throttled
+from utils.templates import get_templates
 from utils.url import get_stream_type, mask_credentials
 
 # utility for resolving stream dimensions
@@ -247,8 +248,7 @@ def init_context(
     trackers_map = trackers
     redis = redis_client
     redisfx = redis_facade
-    templates = Jinja2Templates(directory=templates_path)
-    templates.env.add_extension("jinja2.ext.do")
+    templates = get_templates(templates_path)
     # Recreate the lock for each new application context
     cams_lock = asyncio.Lock()
     camera_manager = CameraManager(
@@ -270,7 +270,7 @@ def init_context(
         except Exception:
             w, h = (640, 480)
         bus = FrameBus()
-        conn = RtspConnector(cam.get("url", ""), w, h)
+        conn = RtspConnector(cam.get("url", ""), w, h, hwaccel=bool(cam.get("hwaccel")))
         q = conn.subscribe()
 
         def _forward(q=q, bus=bus):
@@ -326,25 +326,41 @@ def _expand_ppe_tasks(tasks: List[str]) -> List[str]:
     return list(result)
 
 
-def _validate_ffmpeg_flags(flags: str) -> bool:
-    """Validate ffmpeg flags by parsing and performing a dry-run."""
-    try:
-        parts = shlex.split(flags)
-    except ValueError:
-        return False
+@lru_cache(maxsize=128)
+def _ffmpeg_accepts(flags: str) -> bool:
+    """Return ffmpeg's verdict on *flags*; it cannot change while the process runs.
+
+    A missing binary or a timeout propagates so that result is never cached.
+    """
     try:
         subprocess.run(
-            ["ffmpeg", *parts, "-h"],
+            ["ffmpeg", *shlex.split(flags), "-h"],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
             check=True,
             timeout=5,
         )
+    except subprocess.CalledProcessError:
+        return False
+    return True
+
+
+def _validate_ffmpeg_flags(flags: str) -> bool:
+    """Validate ffmpeg flags by parsing and performing a dry-run.
+
+    Verdicts for recent flag strings are cached so repeated saves of the same
+    flags do not fork ``ffmpeg`` again. Timeouts are not cached.
+    """
+    try:
+        shlex.split(flags)
+    except ValueError:
+        return False
+    try:
+        return _ffmpeg_accepts(flags)
     except FileNotFoundError:
         return True
-    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+    except subprocess.TimeoutExpired:
         return False
-    return True
 
 
 @router.post("/api/cameras")
@@ -582,6 +598,7 @@ async def add_camera(request: Request, manager: CameraManager = Depends(get_came
         tasks.append("visitor_mgmt")
     reverse = bool(data.get("reverse"))
     show = bool(data.get("show", False))
+    hwaccel = bool(data.get("hwaccel", False))
     line_orientation = data.get("line_orientation", "vertical")
     orientation = data.get("orientation", "vertical")
     transport = data.get("transport", "tcp")
@@ -702,6 +719,7 @@ async def add_camera(request: Request, manager: CameraManager = Depends(get_came
             "enabled": enabled,
             "show": show,
             "reverse": reverse,
+            "hwaccel": hwaccel,
             "line_orientation": line_orientation,
             "line": line,
             "orientation": orientation,
@@ -962,6 +980,8 @@ async def update_camera(
                     cam["show"] = bool(data["show"])
                 if "reverse" in data:
                     cam["reverse"] = bool(data["reverse"])
+                if "hwaccel" in data:
+                    cam["hwaccel"] = bool(data["hwaccel"])
                 if "line_orientation" in data:
                     cam["line_orientation"] = data["line_orientation"]
                 if "orientation" in data:
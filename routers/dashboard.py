@@ -26,6 +26,7 @@ from config import ANOMALY_ITEMS, PPE_ITEMS, PPE_TASKS
 from modules.email_utils import sign_token
 from modules.tracker import PersonTracker
 from modules.utils import require_roles
+from utils import fastjson
 from utils.async_utils import run_with_timeout
 from utils.deps import (
     get_cameras,
@@ -35,6 +36,7 @@ from utils.deps import (
     get_templates,
     get_trackers,
 )
+from utils.jpeg import mjpeg_part
 from utils.logx import log_throttled
 from utils.time import parse_range
 
@@ -246,7 +248,7 @@ async def _stream_response(
                 tr.restart_capture = True
         no_frame_logged = False
         last_buf: bytes | None = None
-        boundary = b"--frame\r\nContent-Type: image/jpeg\r\n\r\n"
+        last_frame = None
         interval = 1 / (min(tr.fps, TARGET_FPS) if not raw else TARGET_FPS)
         last_sent = 0.0
         try:
@@ -258,10 +260,14 @@ async def _stream_response(
                             f"[{cam_id}] Resumed frames for {'clean' if raw else 'preview'}"
                         )
                         no_frame_logged = False
-                    if raw and hasattr(frame, "download"):
-                        frame = frame.download()
-                    _, buf = cv2.imencode(".jpg", frame)
-                    last_buf = buf.tobytes()
+                    # the tracker often runs slower than the send interval;
+                    # only re-encode when it has published a new frame
+                    if frame is not last_frame:
+                        last_frame = frame
+                        if raw and hasattr(frame, "download"):
+                            frame = frame.download()
+                        _, buf = cv2.imencode(".jpg", frame)
+                        last_buf = mjpeg_part(buf.tobytes())
                 else:
                     if not no_frame_logged:
                         logger.warning(f"[{cam_id}] No frame for {'clean' if raw else 'preview'}")
@@ -274,7 +280,7 @@ async def _stream_response(
                 if wait > 0:
                     await asyncio.sleep(wait)
                 try:
-                    yield boundary + last_buf + b"\r\n"
+                    yield last_buf
                 except Exception as exc:
                     log_throttled(
                         logger.warning,
@@ -333,7 +339,7 @@ async def stats_event_source(
     while True:
         try:
             init = gather_stats(trackers_map, redis, store)
-            yield f"data: {json.dumps(init)}\n\n"
+            yield f"data: {fastjson.dumps(init)}\n\n"
             if use_stream:
                 last_id = "$"
                 while True:
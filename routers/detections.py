@@ -13,6 +13,7 @@ from fastapi.templating import Jinja2Templates
 from starlette.websockets import WebSocketDisconnect, WebSocketState
 
 from modules.email_utils import sign_token
+from utils import fastjson
 from utils.deps import get_cameras, get_settings, get_templates, get_trackers
 from utils.video import async_get_stream_resolution
 
@@ -236,7 +237,7 @@ async def detections_ws(
                 fallback_ttl=cfg.get("stream_probe_fallback_ttl"),
             )
             if payload != last_payload:
-                await ws.send_json(payload)
+                await ws.send_text(fastjson.dumps(payload))
                 last_payload = payload
             await asyncio.sleep(0.2)
 
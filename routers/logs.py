@@ -9,6 +9,7 @@ from typing import AsyncIterator
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import JSONResponse, StreamingResponse
 
+from utils import fastjson
 from utils.deps import get_redis
 
 router = APIRouter()
@@ -49,8 +50,8 @@ async def events_source(redis, camera_id: int | None) -> AsyncIterator[str]:
         new_events = []
         for raw in reversed(raw_items):
             try:
-                item = json.loads(raw)
-            except Exception:
+                item = fastjson.loads(raw)
+            except ValueError:
                 continue
             ts = float(item.get("ts", 0))
             if ts <= last_ts:
@@ -60,7 +61,7 @@ async def events_source(redis, camera_id: int | None) -> AsyncIterator[str]:
             new_events.append(item)
         for item in new_events:
             last_ts = max(last_ts, float(item.get("ts", 0)))
-            yield f"data: {json.dumps(item)}\n\n"
+            yield f"data: {fastjson.dumps(item)}\n\n"
         await asyncio.sleep(1)
 
 
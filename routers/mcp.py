@@ -7,6 +7,8 @@ from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 
+from utils.templates import get_templates
+
 router = APIRouter()
 
 cfg: dict = {}
@@ -19,8 +21,7 @@ def init_context(config: dict, templates_path: str, redis_facade=None) -> None:
     global cfg, templates, redisfx
     cfg = config
     redisfx = redis_facade
-    templates = Jinja2Templates(directory=templates_path)
-    templates.env.add_extension("jinja2.ext.do")
+    templates = get_templates(templates_path)
 
 
 @router.get("/mcp", response_class=HTMLResponse)
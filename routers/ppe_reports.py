@@ -11,7 +11,6 @@ from typing import Dict
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
-from fastapi.templating import Jinja2Templates
 from loguru import logger
 
 from config import ANOMALY_ITEMS, config
@@ -21,6 +20,7 @@ from modules.tracker import PersonTracker
 from modules.utils import require_roles
 from schemas.ppe_report import PPEReportQuery
 from utils.redis_json import get_json, set_json
+from utils.templates import get_templates
 
 # ruff: noqa: B008
 
@@ -44,8 +44,7 @@ def init_context(
     trackers_map = trackers
     redis = redis_client
     redisfx = redis_facade
-    templates = Jinja2Templates(directory=templates_path)
-    templates.env.add_extension("jinja2.ext.do")
+    templates = get_templates(templates_path)
 
 
 @router.get("/ppe_report")
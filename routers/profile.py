@@ -15,6 +15,7 @@ from PIL import Image, ImageOps
 
 from config.storage import save_config
 from utils.ids import generate_id
+from utils.templates import get_templates
 
 router = APIRouter()
 
@@ -41,8 +42,7 @@ def init_context(
     cfg.setdefault("preferences", {})
     redis = redis_client
     redisfx = redis_facade
-    templates = Jinja2Templates(directory=templates_path)
-    templates.env.add_extension("jinja2.ext.do")
+    templates = get_templates(templates_path)
     cfg_path = config_path
     tz = cfg["preferences"].get("timezone")
     if tz:
@@ -4,23 +4,61 @@ from __future__ import annotations
 
 import json
 import os
+import weakref
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import JSONResponse, RedirectResponse
 from loguru import logger
-from redis.exceptions import RedisError
+from redis.exceptions import RedisError, ResponseError
 
 from core.context import AppContext, get_app_context
 from modules import export
 from modules.utils import require_roles
 from schemas.report import ReportQuery
+from utils import fastjson
 from utils.time import format_ts
 
 router = APIRouter()
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+REPORT_KEYS = ("history", "person_logs", "vehicle_logs")
+
+# Returns 1 as soon as any of KEYS holds a non-empty sorted set.
+_HAS_ANY_LUA = (
+    "for _, k in ipairs(KEYS) do "
+    "if redis.call('ZCARD', k) > 0 then return 1 end "
+    "end return 0"
+)
+# error text meaning the server cannot run scripts at all
+_NO_SCRIPTING = ("unknown command", "scripting is disabled", "no permissions")
+
+_has_any_scripts: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _has_report_data(r) -> bool:
+    """Return ``True`` when any report key contains entries.
+
+    Uses a cached Lua script so the check costs a single round trip and stops
+    at the first non-empty key. Falls back to ``ZCARD`` calls for clients or
+    servers without scripting support.
+    """
+    script = _has_any_scripts.get(r)
+    if script is None and hasattr(r, "register_script"):
+        script = _has_any_scripts[r] = r.register_script(_HAS_ANY_LUA)
+    if script:
+        try:
+            # Script reloads the body itself when the server replies NOSCRIPT
+            return bool(script(keys=REPORT_KEYS))
+        except ResponseError as exc:
+            if any(marker in str(exc).lower() for marker in _NO_SCRIPTING):
+                # scripting unavailable on this server; remember and use ZCARD
+                _has_any_scripts[r] = False
+            else:
+                logger.warning("report data script failed: {}", exc)
+    return any(r.zcard(k) for k in REPORT_KEYS)
+
 
 # init_context routine
 def init_context(
@@ -57,9 +95,7 @@ async def report_page(
     )
     error_message = None
     try:
-        r = ctx.redis
-        if r.zcard("history") or r.zcard("person_logs") or r.zcard("vehicle_logs"):
-            no_data = False
+        no_data = not _has_report_data(ctx.redis)
     except Exception as exc:
         error_message = "Error retrieving report data"
         logger.exception("report data check failed: {}", exc)
@@ -116,14 +152,14 @@ async def _report_data(query: ReportQuery, ctx: AppContext):
     else:
         cursor = query.cursor
         last_ts = None
-        if isinstance(cursor, int) and cursor > 0:
-            last_ts = cursor
-        else:
+        if isinstance(cursor, int):
+            if cursor > 0:
+                last_ts = cursor
+        elif isinstance(cursor, (str, bytes)) and cursor[:1] in ("{", b"{"):
+            # only object-shaped cursors are worth handing to the parser
             try:
-                cur_data = json.loads(cursor)
-                last_ts = cur_data.get("last_ts")
-                cur_data.get("last_id")
-            except Exception:
+                last_ts = fastjson.loads(cursor).get("last_ts")
+            except ValueError:
                 last_ts = None
 
         key = "events"
@@ -139,15 +175,19 @@ async def _report_data(query: ReportQuery, ctx: AppContext):
                 key, last_ts, start_ts, start=1, num=query.rows
             )
 
-        events = []
-        for item in raw_entries:
-            try:
-                e = json.loads(item)
-            except Exception:  # pragma: no cover - bad data
-                continue
-            if query.cam_id is not None and e.get("cam_id") != query.cam_id:
-                continue
-            events.append(e)
+        try:
+            decoded = [fastjson.loads(item) for item in raw_entries]
+        except ValueError:  # pragma: no cover - bad data
+            decoded = []
+            for item in raw_entries:
+                try:
+                    decoded.append(fastjson.loads(item))
+                except ValueError:
+                    continue
+        cam_id = query.cam_id
+        events = (
+            decoded if cam_id is None else [e for e in decoded if e.get("cam_id") == cam_id]
+        )
 
         next_cursor = None
         if events:
@@ -228,11 +268,15 @@ async def report_export(
             return JSONResponse({"status": "error", "reason": "export_failed"}, status_code=500)
     else:
         rows = data["rows"]
+        # join with a precomputed prefix instead of os.path.join per row
+        base = f"{BASE_DIR}{os.sep}"
         for row in rows:
-            if row.get("path"):
-                row["img_file"] = os.path.join(BASE_DIR, row["path"].lstrip("/"))
-            if row.get("plate_path"):
-                row["plate_file"] = os.path.join(BASE_DIR, row["plate_path"].lstrip("/"))
+            path = row.get("path")
+            if path:
+                row["img_file"] = base + path.lstrip("/").replace("/", os.sep)
+            plate_path = row.get("plate_path")
+            if plate_path:
+                row["plate_file"] = base + plate_path.lstrip("/").replace("/", os.sep)
         columns = [
             ("time", "Time"),
             ("cam_id", "Camera"),
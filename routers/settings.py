@@ -25,6 +25,7 @@ from modules.email_utils import send_email
 from modules.tracker import PersonTracker
 from modules.utils import require_admin
 from schemas.alerts import EmailConfig
+from utils.templates import get_templates
 
 # ruff: noqa: B008
 
@@ -67,8 +68,7 @@ def create_settings_context(
 ) -> SettingsContext:
     """Construct and store context for settings routes."""
     global _context
-    templates = Jinja2Templates(directory=templates_path)
-    templates.env.add_extension("jinja2.ext.do")
+    templates = get_templates(templates_path)
     branding = load_branding(branding_file)
     if config.get("helmet_conf_thresh") is not None and "ppe_conf_thresh" not in config:
         config["ppe_conf_thresh"] = config.get("helmet_conf_thresh")
@@ -233,8 +233,7 @@ async def settings_page(request: Request, ctx: SettingsContext = Depends(get_set
         # directory that lacks ``settings.html``.  Recreate the templates
         # environment using the original ``templates_dir`` so subsequent
         # requests can still render the built-in templates.
-        ctx.templates = Jinja2Templates(directory=ctx.templates_dir)
-        ctx.templates.env.add_extension("jinja2.ext.do")
+        ctx.templates = get_templates(ctx.templates_dir)
         return ctx.templates.TemplateResponse(
             "settings.html",
             {
@@ -6,6 +6,7 @@ import asyncio
 import json
 import time
 import uuid
+from queue import Empty
 from typing import Any, AsyncIterator, Dict, List
 from urllib.parse import urlparse
 
@@ -198,10 +199,16 @@ async def _stream_run(run_id: str) -> AsyncIterator[str]:
         return
     loop = asyncio.get_running_loop()
     while True:
-        msg = await loop.run_in_executor(None, queue.get)
-        payload = json.dumps(msg)
-        yield f"data: {payload}\n\n"
-        if msg.get("stage") == "complete":
+        msgs = [await loop.run_in_executor(None, queue.get)]
+        # send whatever else is already queued in the same chunk instead of
+        # paying an executor hop and a write per stage
+        while msgs[-1].get("stage") != "complete":
+            try:
+                msgs.append(queue.get_nowait())
+            except Empty:
+                break
+        yield "".join(f"data: {json.dumps(msg)}\n\n" for msg in msgs)
+        if msgs[-1].get("stage") == "complete":
             ts_runner.cleanup(run_id)
             break
 
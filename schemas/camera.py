@@ -72,6 +72,7 @@ class CameraBase(BaseModel):
     inout_count: Optional[bool] = None
     reverse: Optional[bool] = None
     show: Optional[bool] = None
+    hwaccel: Optional[bool] = None
     site_id: Optional[int] = None
     line: Optional[list[Point]] = None
     enabled: Optional[bool] = None
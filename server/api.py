@@ -9,6 +9,8 @@ import yaml
 from fastapi import FastAPI, HTTPException, Response
 from fastapi.responses import StreamingResponse
 
+from utils.jpeg import mjpeg_part
+
 PipelineType = Any
 app: FastAPI
 
@@ -136,7 +138,7 @@ def stream() -> StreamingResponse:
         frames = pipeline.frames()
         try:
             for frame in frames:
-                yield b"--frame\r\nContent-Type: image/jpeg\r\n\r\n" + frame + b"\r\n"
+                yield mjpeg_part(frame)
         finally:
             close = getattr(frames, "close", None)
             if close:
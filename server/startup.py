@@ -47,7 +47,7 @@ try:  # pragma: no cover - OpenCV is optional
     import cv2  # type: ignore  # noqa: F401,E402
 except Exception:  # pragma: no cover - dependency may be missing
     cv2 = None  # type: ignore[assignment]
-from fastapi.templating import Jinja2Templates  # noqa: E402
+from utils.templates import get_templates  # noqa: E402
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 TEMPLATE_DIR = BASE_DIR / "templates"
@@ -168,6 +168,7 @@ def init_app(
     cfg["secret_key"] = os.getenv("CSRF_SECRET_KEY", cfg.get("secret_key", ""))
 
     set_log_level(cfg.get("log_level", LOG_LEVEL))
+    logx.set_min_level(cfg.get("log_level", LOG_LEVEL))
     probe_gstreamer(cfg)
 
     branding_path = str(Path(config_path_local).with_name("branding.json"))
@@ -217,9 +218,7 @@ def init_app(
     app.state.visitor_worker = None
     app.state.alert_worker = None
     app.state.branding_path = branding_path
-    templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
-    templates.env.add_extension("jinja2.ext.do")
-    app.state.templates = templates
+    app.state.templates = get_templates(TEMPLATE_DIR)
 
     monitor_readiness(app)
 
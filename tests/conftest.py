@@ -46,15 +46,6 @@ sys.modules.setdefault(
 import server.startup as startup
 from utils.redis_facade import RedisFacade
 
-sys.modules["cv2"] = sys.modules.get(
-    "cv2",
-    types.SimpleNamespace(
-        cvtColor=lambda img, code: img,
-        COLOR_BGR2RGB=0,
-        imwrite=lambda *a, **k: True,
-    ),
-)
-
 import threading
 
 import modules.utils as m_utils
@@ -119,6 +110,11 @@ def _stub_probe(monkeypatch, request):
     )
 
 
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
 @pytest.fixture(scope="session")
 def client() -> TestClient:
     mp = pytest.MonkeyPatch()
@@ -168,17 +164,24 @@ def client() -> TestClient:
     mp.undo()
 
 
+# One in-process server shared by the Redis fixtures; the autouse flush below
+# resets it between tests instead of allocating a new server per test.
+_FAKE_SERVER = fakeredis.FakeServer()
+_FLUSH_CLIENT = fakeredis.FakeRedis(server=_FAKE_SERVER)
+
+
+@pytest.fixture(scope="session")
+def fake_server() -> fakeredis.FakeServer:
+    return _FAKE_SERVER
+
+
 @pytest.fixture(scope="function")
-def redis_client():
-    client = fakeredis.FakeRedis(decode_responses=True)
-    client.flushall()
-    yield client
-    client.flushall()
+def redis_client(fake_server):
+    return fakeredis.FakeRedis(server=fake_server, decode_responses=True)
 
 
 @pytest.fixture(autouse=True)
 def _flush_redis():
-    client = fakeredis.FakeRedis()
-    client.flushall()
+    _FLUSH_CLIENT.flushall()
     yield
-    client.flushall()
+    _FLUSH_CLIENT.flushall()
@@ -1,13 +1,8 @@
 import json
-import sys
-import types
 
 import pytest
 from pydantic import BaseModel, ValidationError, model_validator
 
-# Stub heavy dependencies before importing the module under test
-sys.modules.setdefault("cv2", types.SimpleNamespace())
-
 from routers.cameras import _validation_response
 from schemas.camera import CameraCreate
 
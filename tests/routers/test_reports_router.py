@@ -57,3 +57,63 @@ def test_report_data_time_field_format(redis_client, client):
     assert res.status_code == 200
     data = res.json()
     assert data["rows"][0]["time"] == format_ts(entry["ts"], "%Y-%m-%d %H:%M")
+
+
+def test_has_report_data_falls_back_without_scripting(redis_client):
+    assert reports._has_report_data(redis_client) is False
+    redis_client.zadd("vehicle_logs", {"{}": 1})
+    assert reports._has_report_data(redis_client) is True
+    assert reports._has_any_scripts[redis_client] is False
+
+
+class _ScriptClient(fakeredis.FakeRedis):
+    """Client whose script raises the queued errors before succeeding."""
+
+    def __init__(self, errors):
+        super().__init__()
+        self.errors = list(errors)
+        self.calls = 0
+
+    def register_script(self, script):
+        def run(keys):
+            self.calls += 1
+            if self.errors:
+                raise self.errors.pop(0)
+            return 1
+
+        return run
+
+
+def test_has_report_data_keeps_script_after_transient_error():
+    from redis.exceptions import ResponseError
+
+    r = _ScriptClient([ResponseError("BUSY Redis is busy running a script")])
+    assert reports._has_report_data(r) is False
+    assert reports._has_report_data(r) is True
+    assert r.calls == 2
+
+
+def test_report_data_accepts_json_cursor(redis_client):
+    import asyncio
+    from types import SimpleNamespace
+
+    now = int(time.time())
+    for ts in (now - 2, now - 1, now):
+        entry = {"ts": ts, "cam_id": 1, "track_id": ts, "direction": "in", "label": "person"}
+        redis_client.zadd("person_logs", {json.dumps(entry): ts})
+    query = SimpleNamespace(
+        start=datetime.fromtimestamp(now - 60),
+        end=datetime.fromtimestamp(now + 60),
+        view="table",
+        type="person",
+        rows=10,
+        cam_id=None,
+        label="person",
+        cursor=json.dumps({"last_ts": now, "last_id": str(now)}),
+    )
+    ctx = SimpleNamespace(redis=redis_client)
+    data = asyncio.run(reports._report_data(query, ctx))
+    assert [row["track_id"] for row in data["rows"]] == [now - 1, now - 2]
+    query.cursor = "not-json"
+    data = asyncio.run(reports._report_data(query, ctx))
+    assert len(data["rows"]) == 3
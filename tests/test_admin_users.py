@@ -25,11 +25,6 @@ if not hasattr(torch_mod, "device"):
 pytestmark = pytest.mark.anyio
 
 
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
 class DummyRedis:
     def set(self, key, value):
         pass
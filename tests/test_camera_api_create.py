@@ -1,16 +1,12 @@
 """Test API endpoint for creating cameras."""
 
 import json
-import sys
 import threading
-from types import SimpleNamespace
 
 import fakeredis
 import pytest
 from loguru import logger
 
-sys.modules.setdefault("cv2", SimpleNamespace())
-
 from routers import cameras
 
 
@@ -9,12 +9,7 @@ pytestmark = pytest.mark.anyio
 
 
 @pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
-@pytest.fixture
-async def client(tmp_path, monkeypatch):
+async def client(tmp_path, monkeypatch, fake_server):
     cfg = {
         "license_info": {"features": {"in_out_counting": True}},
         "features": {"in_out_counting": True},
@@ -30,7 +25,7 @@ async def client(tmp_path, monkeypatch):
             "enabled": True,
         }
     ]
-    r = fakeredis.FakeRedis()
+    r = fakeredis.FakeRedis(server=fake_server)
     cameras.init_context(cfg, cams, {}, r, str(tmp_path))
     monkeypatch.setattr(cameras, "require_roles", lambda r, roles: {"role": "admin"})
 
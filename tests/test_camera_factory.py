@@ -23,11 +23,6 @@ class Dummy(IFrameSource):
         pass
 
 
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
 def test_rtsp_backend_selection(monkeypatch):
     monkeypatch.setattr(cf, "RtspFfmpegSource", Dummy)
     monkeypatch.setattr(cf, "RtspGstSource", Dummy)
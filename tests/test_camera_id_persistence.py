@@ -37,15 +37,10 @@ pytestmark = pytest.mark.anyio
 
 
 @pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
-@pytest.fixture
-async def api_client(tmp_path, monkeypatch):
+async def api_client(tmp_path, monkeypatch, fake_server):
     cfg = {}
     cams = []
-    r = fakeredis.FakeRedis()
+    r = fakeredis.FakeRedis(server=fake_server)
     cameras.init_context(cfg, cams, {}, r, str(tmp_path))
     monkeypatch.setattr(cameras, "require_roles", lambda r, roles: {"role": "admin"})
     app = FastAPI()
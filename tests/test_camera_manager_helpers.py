@@ -8,11 +8,6 @@ from core.camera_manager import CameraManager
 pytestmark = pytest.mark.anyio
 
 
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
 async def test_snapshot_uses_cached_frame():
     cams = [{"id": 1, "url": "", "tasks": []}]
     trackers = {}
@@ -23,7 +18,7 @@ async def test_snapshot_uses_cached_frame():
     def stop(cid, tr):
         return None
 
-    mgr = CameraManager({}, trackers, {}, None, lambda: cams, start, stop)
+    mgr = CameraManager({}, trackers, None, lambda: cams, start, stop)
 
     frame = np.ones((2, 2, 3), dtype=np.uint8)
     mgr.update_latest_frame(1, frame)
@@ -32,4 +27,11 @@ async def test_snapshot_uses_cached_frame():
     ok, got, detail = await mgr.snapshot(1)
     assert ok is True
     assert detail == "from_cache"
-    assert np.array_equal(got, frame)
+    assert got is frame or got.base is frame
+
+
+async def test_build_flags():
+    mgr = CameraManager({}, {}, None, lambda: [], lambda *a: None, lambda *a: None)
+    flags = mgr._build_flags({"ppe": True, "tasks": ["out_count"]})
+    assert flags == {"enabled": True, "ppe": True, "vms": False, "counting": True}
+    assert mgr._build_flags({"enabled": False})["counting"] is False
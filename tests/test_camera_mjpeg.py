@@ -36,6 +36,7 @@ def test_mjpeg_stream(monkeypatch):
         resp = await cameras.camera_mjpeg(1)
         assert resp.status_code == 200
         gen = resp.body_iterator
+        # async generators reject overlapping __anext__ calls, so drain in order
         first = await gen.__anext__()
         second = await gen.__anext__()
         assert b"A" in first and b"B" in second
@@ -32,3 +32,43 @@ def test_pipeline_crud(client):
     assert stored["backend"] == "ffmpeg"
     assert stored["ffmpeg_flags"] == "-an"
     assert stored["profile"] == "recording"
+
+
+def test_ffmpeg_flag_validation_is_cached(monkeypatch):
+    import subprocess
+
+    from routers import cameras
+
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        if "-bogus" in cmd:
+            raise subprocess.CalledProcessError(1, cmd)
+
+    monkeypatch.setattr(cameras.subprocess, "run", fake_run)
+    cameras._ffmpeg_accepts.cache_clear()
+    assert cameras._validate_ffmpeg_flags("-an")
+    assert cameras._validate_ffmpeg_flags("-an")
+    assert not cameras._validate_ffmpeg_flags("-bogus")
+    assert not cameras._validate_ffmpeg_flags("-bogus")
+    assert len(calls) == 2
+    cameras._ffmpeg_accepts.cache_clear()
+
+
+def test_ffmpeg_flag_timeout_is_not_cached(monkeypatch):
+    import subprocess
+
+    from routers import cameras
+
+    calls = []
+
+    def slow_run(cmd, **kwargs):
+        calls.append(cmd)
+        raise subprocess.TimeoutExpired(cmd, 5)
+
+    monkeypatch.setattr(cameras.subprocess, "run", slow_run)
+    cameras._ffmpeg_accepts.cache_clear()
+    assert not cameras._validate_ffmpeg_flags("-an")
+    assert not cameras._validate_ffmpeg_flags("-an")
+    assert len(calls) == 2
@@ -24,6 +24,11 @@ def test_line_optional_for_counting():
     assert len(cam.line) == 2
 
 
+def test_hwaccel_round_trips():
+    cam = CameraCreate(name="c1", url="rtsp://a", hwaccel=True)
+    assert cam.model_dump()["hwaccel"] is True
+
+
 def test_site_id_defaults(monkeypatch):
     import routers.cameras as rc
 
@@ -1,5 +1,7 @@
 import importlib
 
+import numpy as np
+
 counting = importlib.import_module("app.vision.counting")
 
 
@@ -10,6 +12,18 @@ def test_side_of_line():
     assert counting.side_of_line((-1, 0, 1, 2), line) == 0
 
 
+def test_side_of_line_batch():
+    bboxes = np.array([[1, 0, 3, 2], [-3, 0, -1, 2], [-1, 0, 1, 2]])
+    assert np.array_equal(counting.side_of_line_batch(bboxes, (0, 0, 0, 2)), [-1, 1, 0])
+
+
+def test_side_of_points_eps():
+    points = np.array([[10, 20], [90, 20], [50, 40], [51, 5]])
+    line = (50.0, 0.0, 50.0, 99.0)
+    assert counting.side_of_points(points, line).tolist() == [1, -1, 0, -1]
+    assert counting.side_of_points(points, line, eps=200.0).tolist() == [1, -1, 0, 0]
+
+
 def test_cross_events():
     assert counting.cross_events(-1, 1) == ["in"]
     assert counting.cross_events(1, -1) == ["out"]
@@ -30,3 +44,20 @@ def test_count_update_single_cross():
     tracks = {1: {"bbox": (1, -1, 2, 1), "group": "person", "ts_ms": 2}}
     state, events = counting.count_update(state, tracks, line_cfg)
     assert events == []
+
+
+def test_count_update_batched():
+    line_cfg = {"id": "L1", "line": (0, 0, 0, 2)}
+    n = 1000
+    right = {tid: {"bbox": (1, -1, 2, 1), "ts_ms": 0} for tid in range(n)}
+    state, events = counting.count_update({}, right, line_cfg)
+    assert events == []
+    # even tracks cross to the left, odd ones stay put
+    moved = {
+        tid: {"bbox": (-2, -1, -1, 1) if tid % 2 == 0 else (1, -1, 2, 1), "ts_ms": 1}
+        for tid in range(n)
+    }
+    state, events = counting.count_update(state, moved, line_cfg)
+    assert [e.track_id for e in events] == list(range(0, n, 2))
+    assert {e.kind for e in events} == {"in"}
+    assert state["L1"][1] == {"last_side": -1, "counted": False}
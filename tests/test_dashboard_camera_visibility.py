@@ -7,7 +7,6 @@ from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
-sys.modules.setdefault("cv2", types.SimpleNamespace())
 
 from routers import dashboard  # noqa: E402
 
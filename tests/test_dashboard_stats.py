@@ -21,11 +21,6 @@ def _patch_redis():
     yield
 
 
-@pytest.fixture
-def anyio_backend():  # pragma: no cover - used by anyio
-    return "asyncio"
-
-
 def test_dashboard_stats_missing_entry_exit(client):
     resp = client.get("/api/dashboard/stats")
     assert resp.status_code == 200
@@ -4,9 +4,9 @@ import sys
 import numpy as np
 from starlette.requests import Request
 
-sys.modules.setdefault(
-    "cv2", type("cv2", (), {"imencode": lambda *a, **k: (True, np.array([0], dtype=np.uint8))})
-)
+_FAKE_JPEG = np.array([0], dtype=np.uint8)
+
+sys.modules.setdefault("cv2", type("cv2", (), {"imencode": lambda *a, **k: (True, _FAKE_JPEG)}))
 
 from routers.dashboard import stream_preview
 
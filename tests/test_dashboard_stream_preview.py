@@ -5,8 +5,10 @@ import types
 import numpy as np
 from starlette.requests import Request
 
+_FAKE_JPEG = np.array([0], dtype=np.uint8)
+
 cv2_stub = sys.modules.setdefault("cv2", types.SimpleNamespace())
-cv2_stub.imencode = lambda *a, **k: (True, np.array([0], dtype=np.uint8))
+cv2_stub.imencode = lambda *a, **k: (True, _FAKE_JPEG)
 
 from routers.dashboard import stream_preview
 
@@ -2,7 +2,7 @@ import asyncio
 import sys
 import types
 
-# minimal stubs for modules.tracker and cv2 dependencies
+# minimal stubs for modules.tracker dependencies
 tracker_mod = types.ModuleType("modules.tracker")
 
 
@@ -15,7 +15,6 @@ modules_pkg = types.ModuleType("modules")
 modules_pkg.tracker = tracker_mod
 sys.modules.setdefault("modules", modules_pkg)
 sys.modules.setdefault("modules.tracker", tracker_mod)
-sys.modules.setdefault("cv2", types.ModuleType("cv2"))
 
 from routers.detections import _build_payload
 
@@ -14,7 +14,6 @@ modules_pkg = types.ModuleType("modules")
 modules_pkg.tracker = tracker_mod
 sys.modules.setdefault("modules", modules_pkg)
 sys.modules.setdefault("modules.tracker", tracker_mod)
-sys.modules.setdefault("cv2", types.ModuleType("cv2"))
 
 from routers.detections import _build_payload
 
@@ -0,0 +1,19 @@
+from modules.tracker import detector
+
+
+def test_imgsz_from_env(monkeypatch):
+    monkeypatch.setattr(detector, "get_sync_client", None)
+    monkeypatch.setenv("VMS26_IMGSZ", "416")
+    assert detector.Detector(object(), "cpu").predict_kwargs["imgsz"] == 416
+
+
+def test_invalid_imgsz_is_ignored(monkeypatch, caplog):
+    monkeypatch.setattr(detector, "get_sync_client", None)
+    monkeypatch.setenv("VMS26_IMGSZ", "big")
+    handler_id = detector.logger.add(caplog.handler, level="WARNING")
+    try:
+        det = detector.Detector(object(), "cpu")
+    finally:
+        detector.logger.remove(handler_id)
+    assert "imgsz" not in det.predict_kwargs
+    assert "invalid VMS26_IMGSZ" in caplog.text
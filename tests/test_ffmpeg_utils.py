@@ -21,3 +21,11 @@ def test_build_preview_cmd_downscale():
     assert "-vf" in cmd
     idx = cmd.index("-vf") + 1
     assert cmd[idx] == "scale=trunc(iw/2/2)*2:trunc(ih/2/2)*2"
+
+
+def test_build_cmd_reuses_template_per_url():
+    first = ffmpeg_utils.build_snapshot_cmd("rtsp://a", "tcp")
+    first.append("mutated")
+    second = ffmpeg_utils.build_snapshot_cmd("rtsp://b", "tcp")
+    assert "rtsp://b" in second and "rtsp://a" not in second
+    assert "mutated" not in second
@@ -44,3 +44,21 @@ def test_frame_bus_info():
     assert info.w == 20
     assert info.h == 10
     assert info.fps > 0
+
+
+def test_frame_bus_returns_shared_frame():
+    bus = FrameBus()
+    frame = np.zeros((2, 2, 3), dtype=np.uint8)
+    bus.put(frame)
+    assert bus.get_latest(0) is frame
+
+
+def test_frame_bus_get_newer_waits_for_new_frame():
+    bus = FrameBus()
+    frame = np.zeros((1, 1, 3), dtype=np.uint8)
+    bus.put(frame)
+    seq, out = bus.get_newer(0, 0)
+    assert out is frame
+    assert bus.get_newer(seq, 50) == (seq, None)
+    bus.put(frame)
+    assert bus.get_newer(seq, 0)[0] == seq + 1
@@ -1,11 +1,8 @@
-import sys
-
 import pytest
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.websockets import WebSocket
 
-sys.modules.setdefault("cv2", type("cv2", (), {}))
 from utils.deps import get_settings
 
 
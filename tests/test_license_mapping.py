@@ -22,7 +22,6 @@ sys.modules.setdefault(
 sys.modules.setdefault("ultralytics", type("ultralytics", (), {"YOLO": object}))
 sys.modules.setdefault("deep_sort_realtime", type("ds", (), {}))
 sys.modules["deep_sort_realtime.deepsort_tracker"] = type("t", (), {"DeepSort": object})
-sys.modules.setdefault("cv2", type("cv2", (), {}))
 
 from routers import cameras
 
@@ -1,4 +1,7 @@
 import asyncio
+import importlib.util
+import sys
+import threading
 from types import SimpleNamespace
 
 import numpy as np
@@ -58,3 +61,138 @@ async def test_jpeg_encoding_only_with_clients(monkeypatch):
     bus.put(frame)
     await asyncio.sleep(0.05)
     assert calls.count == 1
+
+
+def test_mjpeg_part_framing():
+    from utils.jpeg import mjpeg_part
+
+    part = mjpeg_part(b"abc")
+    assert part == (
+        b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: 3\r\n\r\nabc\r\n"
+    )
+
+
+def _load_jpeg_copy(name: str):
+    """Import a private copy of :mod:`utils.jpeg` so its backend is chosen now."""
+    import utils.jpeg
+
+    spec = importlib.util.spec_from_file_location(name, utils.jpeg.__file__)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _has_jpeg_codec() -> bool:
+    from utils import jpeg
+
+    if hasattr(jpeg, "_jpeg"):  # turbojpeg
+        return True
+    cv2 = sys.modules.get("cv2")
+    # cv2 stubs (conftest, other test modules) lack the real codec API; a
+    # missing cv2 means the Pillow path
+    return cv2 is None or (hasattr(cv2, "imdecode") and hasattr(cv2, "IMWRITE_JPEG_QUALITY"))
+
+
+@pytest.mark.skipif(not _has_jpeg_codec(), reason="no real JPEG codec importable")
+def test_decode_jpeg_returns_bgr():
+    jpeg = _load_jpeg_copy("_jpeg_default")
+
+    frame = np.zeros((16, 16, 3), dtype=np.uint8)
+    frame[:, :, 2] = 255  # pure red in BGR order
+    out = jpeg.decode_jpeg(jpeg.encode_jpeg(frame, 95))
+    assert out.shape == (16, 16, 3)
+    assert out[8, 8, 2] > 200 and out[8, 8, 0] < 50
+    assert out.flags.writeable
+
+
+def test_decode_jpeg_pillow_backend(monkeypatch):
+    monkeypatch.setenv("VMS26_TURBOJPEG", "0")
+    monkeypatch.setitem(sys.modules, "cv2", None)
+    pillow = _load_jpeg_copy("_jpeg_pillow")
+
+    frame = np.zeros((16, 16, 3), dtype=np.uint8)
+    frame[:, :, 2] = 255
+    out = pillow.decode_jpeg(pillow.encode_jpeg(frame, 95))
+    assert out.shape == (16, 16, 3)
+    assert out[8, 8, 2] > 200 and out[8, 8, 0] < 50
+    assert out.flags.writeable
+
+
+@pytest.mark.asyncio
+async def test_jpeg_encoded_once_for_all_clients(monkeypatch):
+    bus = FrameBus()
+    pub = PreviewPublisher({1: bus})
+    calls = SimpleNamespace(count=0)
+
+    def fake_encode(frame):  # type: ignore[override]
+        calls.count += 1
+        return b"jpeg"
+
+    monkeypatch.setattr("modules.preview.mjpeg_publisher.encode_jpeg", fake_encode)
+
+    pub.start_show(1)
+    bus.put(np.zeros((1, 1, 3), dtype=np.uint8))
+    gens = [pub.stream(1) for _ in range(3)]
+    chunks = [await asyncio.wait_for(g.__anext__(), 1) for g in gens]
+    assert len(set(chunks)) == 1
+    assert calls.count == 1
+    for g in gens:
+        await g.aclose()
+
+
+@pytest.mark.asyncio
+async def test_client_disconnect_does_not_cancel_shared_encode(monkeypatch):
+    bus = FrameBus()
+    pub = PreviewPublisher({1: bus})
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_encode(frame):  # type: ignore[override]
+        started.set()
+        release.wait(1)
+        return b"jpeg"
+
+    monkeypatch.setattr("modules.preview.mjpeg_publisher.encode_jpeg", slow_encode)
+
+    pub.start_show(1)
+    bus.put(np.zeros((1, 1, 3), dtype=np.uint8))
+    first, second = pub.stream(1), pub.stream(1)
+    t1 = asyncio.create_task(first.__anext__())
+    t2 = asyncio.create_task(second.__anext__())
+    await asyncio.to_thread(started.wait, 1)
+    await asyncio.sleep(0.05)
+    t1.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await t1
+    release.set()
+    chunk = await asyncio.wait_for(t2, 1)
+    assert chunk.startswith(b"--frame")
+    await first.aclose()
+    await second.aclose()
+
+
+@pytest.mark.asyncio
+async def test_failed_encode_is_retried(monkeypatch):
+    bus = FrameBus()
+    pub = PreviewPublisher({1: bus})
+    calls = SimpleNamespace(count=0)
+
+    def flaky_encode(frame):  # type: ignore[override]
+        calls.count += 1
+        if calls.count == 1:
+            raise RuntimeError("boom")
+        return b"jpeg"
+
+    monkeypatch.setattr("modules.preview.mjpeg_publisher.encode_jpeg", flaky_encode)
+
+    pub.start_show(1)
+    bus.put(np.zeros((1, 1, 3), dtype=np.uint8))
+    first = pub.stream(1)
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(first.__anext__(), 1)
+    assert 1 not in pub._parts
+    second = pub.stream(1)
+    bus.put(np.zeros((1, 1, 3), dtype=np.uint8))
+    chunk = await asyncio.wait_for(second.__anext__(), 1)
+    assert chunk.startswith(b"--frame")
+    await second.aclose()
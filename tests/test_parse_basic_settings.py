@@ -1,9 +1,5 @@
-import sys
-
 import pytest
 
-sys.modules.setdefault("cv2", type("cv2", (), {}))
-
 from routers import settings as settings_mod
 
 
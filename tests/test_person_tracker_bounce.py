@@ -109,3 +109,6 @@ def test_multiple_crossings_count_once(tmp_path):
 
     assert tracker.in_counts.get("person", 0) == 1
     assert tracker.out_counts.get("person", 0) == 1
+    # crossings refresh the camera state hash in one pipelined write
+    assert r.hget("cam:1:state", "last_error") == b""
+    assert 0 < r.ttl("cam:1:state") <= 15
@@ -12,7 +12,6 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
 # Stub heavy deps
-sys.modules.setdefault("cv2", type("cv2", (), {}))
 sys.modules.setdefault(
     "torch",
     type("torch", (), {"cuda": type("cuda", (), {"is_available": lambda: False})}),
@@ -8,11 +8,6 @@ from fakeredis.aioredis import FakeRedis as AsyncFakeRedis
 from utils.redis_facade import RedisFacade
 
 
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
 @pytest.mark.anyio
 async def test_sync_operations():
     r = fakeredis.FakeRedis(decode_responses=True)
@@ -16,7 +16,6 @@ from fastapi.testclient import TestClient
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
-sys.modules.setdefault("cv2", type("cv2", (), {}))
 sys.modules.setdefault(
     "torch",
     type("torch", (), {"cuda": type("cuda", (), {"is_available": lambda: False})}),
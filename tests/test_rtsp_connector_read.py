@@ -0,0 +1,45 @@
+import os
+import threading
+import time
+
+import numpy as np
+
+from modules.stream.rtsp_connector import RtspConnector
+
+
+def test_read_frame_joins_partial_reads():
+    r, w = os.pipe()
+    data = bytes(range(12))
+
+    def _writer():
+        os.write(w, data[:5])
+        time.sleep(0.05)
+        os.write(w, data[5:])
+
+    t = threading.Thread(target=_writer)
+    t.start()
+    frame = np.empty((2, 2, 3), dtype=np.uint8)
+    with os.fdopen(r, "rb", buffering=0) as stdout:
+        got = RtspConnector._read_frame(stdout, frame, 1.0)
+    t.join()
+    os.close(w)
+    assert got == 12
+    assert frame.tobytes() == data
+
+
+def test_read_frame_reports_eof():
+    r, w = os.pipe()
+    os.write(w, b"abc")
+    os.close(w)
+    frame = np.empty((2, 2, 3), dtype=np.uint8)
+    with os.fdopen(r, "rb", buffering=0) as stdout:
+        assert RtspConnector._read_frame(stdout, frame, 0.1) == 3
+
+
+def test_build_cmd_hwaccel_opt_in():
+    cmd = RtspConnector("rtsp://demo", 64, 48)._build_cmd()
+    assert "-hwaccel" not in cmd
+    assert "scale=64:48:flags=fast_bilinear" in cmd
+    cmd = RtspConnector("rtsp://demo", 64, 48, hwaccel=True)._build_cmd()
+    assert cmd[cmd.index("-hwaccel") + 1] == "auto"
+    assert cmd.index("-hwaccel") < cmd.index("-i")
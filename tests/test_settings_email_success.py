@@ -1,10 +1,5 @@
-import sys
-import types
-
 import pytest
 
-sys.modules.setdefault("cv2", types.SimpleNamespace())
-
 
 @pytest.fixture(autouse=True, scope="session")
 def _patch_health_loop():
@@ -0,0 +1,31 @@
+import queue
+import threading
+
+import pytest
+
+from utils.spsc import SPSCRing
+
+
+def test_fifo_and_bounds():
+    ring = SPSCRing(maxsize=2)
+    assert ring.empty()
+    ring.put(1)
+    ring.put(2)
+    assert ring.full() and ring.qsize() == 2
+    with pytest.raises(queue.Full):
+        ring.put(3, timeout=1)
+    assert ring.get_nowait() == 1
+    assert ring.get(timeout=0.1) == 2
+    with pytest.raises(queue.Empty):
+        ring.get(timeout=0.01)
+
+
+def test_get_wakes_on_put_from_other_thread():
+    ring = SPSCRing(maxsize=4)
+    got = []
+    consumer = threading.Thread(target=lambda: got.extend(ring.get(timeout=2) for _ in range(3)))
+    consumer.start()
+    for i in range(3):
+        ring.put(i)
+    consumer.join(timeout=2)
+    assert got == [0, 1, 2]
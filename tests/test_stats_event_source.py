@@ -9,11 +9,6 @@ import core.stats
 pytestmark = pytest.mark.anyio
 
 
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
 @pytest.fixture
 def dashboard_module():
     import modules.utils as mutils
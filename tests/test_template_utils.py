@@ -0,0 +1,11 @@
+from pathlib import Path
+
+from utils.templates import get_templates
+
+
+def test_get_templates_shared_per_directory(tmp_path):
+    (tmp_path / "page.html").write_text("{% do items.append(1) %}{{ items }}")
+    first = get_templates(tmp_path)
+    assert get_templates(str(tmp_path)) is first
+    assert get_templates(Path(tmp_path) / "other") is not first
+    assert first.get_template("page.html").render(items=[]) == "[1]"
@@ -1,12 +1,9 @@
 import queue
-import sys
-import types
 from types import SimpleNamespace
 from typing import Any
 
 import numpy as np
 
-sys.modules.setdefault("cv2", types.SimpleNamespace())
 import modules.tracker.manager as manager
 
 
@@ -1,5 +1,7 @@
 import asyncio
 
+import pytest
+
 from utils.redis import trim_sorted_set, trim_sorted_set_async
 from utils.redis_facade import RedisFacade
 
@@ -40,11 +42,8 @@ def test_trim_sorted_set_async_path():
     assert client.args == ("k", 0, 90)
 
 
-def test_trim_sorted_set_sync_in_loop_no_error():
+@pytest.mark.anyio
+async def test_trim_sorted_set_sync_in_loop_no_error():
     client = DummyAsyncRedis()
-
-    async def run():
-        await trim_sorted_set(RedisFacade(client), "k", 100, retention_secs=10)
-
-    asyncio.run(run())
+    await trim_sorted_set(RedisFacade(client), "k", 100, retention_secs=10)
     assert client.args == ("k", 0, 90)
@@ -8,11 +8,6 @@ from fastapi.testclient import TestClient
 import routers.troubleshooter as ts
 
 
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
 def test_troubleshooter_rtsp_mode_skips_mjpeg(monkeypatch):
     async def _fake_ping(host):
         return True
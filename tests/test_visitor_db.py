@@ -0,0 +1,24 @@
+"""Purpose: verify VisitorDB writes visitor records and the name index."""
+
+import fakeredis
+
+from modules.visitor_db import VisitorDB
+
+
+def test_save_visitor_writes_record_and_index():
+    r = fakeredis.FakeRedis()
+    db = VisitorDB(r)
+    vid = db.save_visitor("Alice", "123", org="ACME")
+    assert r.hget("visitor:record:123", "id").decode() == vid
+    assert r.zrange("visitor_name_idx", 0, -1) == [b"alice|123"]
+    assert db.search_visitors_by_name("al")[0]["phone"] == "123"
+
+
+def test_index_failure_does_not_fail_save():
+    r = fakeredis.FakeRedis()
+    r.set("visitor_name_idx", "not-a-zset")  # forces ZADD to fail with WRONGTYPE
+    db = VisitorDB(r)
+    vid = db.save_visitor("Bob", "456")
+    assert r.hget("visitor:record:456", "id").decode() == vid
+    vid2 = db.get_or_create_visitor("Carol", "789")
+    assert r.hget("visitor:record:789", "id").decode() == vid2
@@ -0,0 +1,40 @@
+"""JSON helpers backed by :mod:`orjson` when it is installed.
+
+``loads`` accepts ``str`` or ``bytes`` and ``dumps`` returns compact ``str``
+output, so both are drop-in replacements for the stdlib functions on hot
+paths. ``dumpb`` returns the same output as UTF-8 ``bytes`` for sinks such as
+Redis that would otherwise re-encode it. Decode errors raise
+:class:`ValueError` with either backend.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # optional faster backend
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+if orjson is not None:
+    loads = orjson.loads
+    _OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=_OPTS).decode()
+
+    def dumpb(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=_OPTS)
+
+else:  # pragma: no cover - stdlib fallback
+    loads = json.loads
+
+    def dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    def dumpb(obj: Any) -> bytes:
+        return dumps(obj).encode()
+
+
+__all__ = ["loads", "dumps", "dumpb"]
@@ -1,9 +1,23 @@
 from __future__ import annotations
 
+from functools import lru_cache
 
+# placeholder substituted with the stream URL when a cached argv is expanded
+_URL = "__URL__"
 
-def build_preview_cmd(url: str, transport: str, downscale: int | None = None) -> list[str]:
-    """Return ffmpeg command for generating an MJPEG preview."""
+
+def _scale_filter(downscale: int | None) -> list[str]:
+    if downscale and downscale > 1:
+        return ["-vf", f"scale=trunc(iw/{downscale}/2)*2:trunc(ih/{downscale}/2)*2"]
+    return []
+
+
+def _expand(template: tuple[str, ...], url: str) -> list[str]:
+    return [url if arg is _URL else arg for arg in template]
+
+
+@lru_cache(maxsize=64)
+def _preview_template(transport: str, downscale: int | None) -> tuple[str, ...]:
     cmd = [
         "ffmpeg",
         "-nostdin",
@@ -14,13 +28,11 @@ def build_preview_cmd(url: str, transport: str, downscale: int | None = None) ->
         "-rtsp_transport",
         transport,
         "-i",
-        url,
+        _URL,
         "-an",
     ]
     cmd += ["-flags", "low_delay", "-fflags", "nobuffer"]
-    if downscale and downscale > 1:
-        vf = f"scale=trunc(iw/{downscale}/2)*2:trunc(ih/{downscale}/2)*2"
-        cmd += ["-vf", vf]
+    cmd += _scale_filter(downscale)
     cmd += [
         "-threads",
         "1",
@@ -30,13 +42,13 @@ def build_preview_cmd(url: str, transport: str, downscale: int | None = None) ->
         "5",
         "pipe:1",
     ]
-    return cmd
+    return tuple(cmd)
 
 
-def build_snapshot_cmd(url: str, transport: str, downscale: int | None = None) -> list[str]:
-    """Return ffmpeg command for capturing a single JPEG frame."""
+@lru_cache(maxsize=64)
+def _snapshot_template(transport: str, downscale: int | None, is_rtsp: bool) -> tuple[str, ...]:
     cmd = ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error", "-nostats"]
-    if url.startswith("rtsp://"):
+    if is_rtsp:
         cmd += [
             "-rtsp_transport",
             transport,
@@ -56,13 +68,11 @@ def build_snapshot_cmd(url: str, transport: str, downscale: int | None = None) -
             "direct",
             "-an",
             "-i",
-            url,
+            _URL,
         ]
     else:
-        cmd += ["-i", url, "-an", "-flags", "low_delay", "-fflags", "nobuffer"]
-    if downscale and downscale > 1:
-        vf = f"scale=trunc(iw/{downscale}/2)*2:trunc(ih/{downscale}/2)*2"
-        cmd += ["-vf", vf]
+        cmd += ["-i", _URL, "-an", "-flags", "low_delay", "-fflags", "nobuffer"]
+    cmd += _scale_filter(downscale)
     cmd += [
         "-threads",
         "1",
@@ -74,4 +84,14 @@ def build_snapshot_cmd(url: str, transport: str, downscale: int | None = None) -
         "5",
         "pipe:1",
     ]
-    return cmd
+    return tuple(cmd)
+
+
+def build_preview_cmd(url: str, transport: str, downscale: int | None = None) -> list[str]:
+    """Return ffmpeg command for generating an MJPEG preview."""
+    return _expand(_preview_template(transport, downscale), url)
+
+
+def build_snapshot_cmd(url: str, transport: str, downscale: int | None = None) -> list[str]:
+    """Return ffmpeg command for capturing a single JPEG frame."""
+    return _expand(_snapshot_template(transport, downscale, url.startswith("rtsp://")), url)
@@ -2,19 +2,28 @@ from __future__ import annotations
 
 from os import getenv
 
+import numpy as np
+
 from app.core.prof import profiled
 
 DEFAULT_JPEG_QUALITY = int(getenv("VMS26_JPEG_QUALITY", "80"))
 
 try:  # Prefer turbojpeg when available
     if getenv("VMS26_TURBOJPEG", "auto") in ("auto", "1"):
-        from turbojpeg import TurboJPEG  # type: ignore
+        from turbojpeg import TJPF_BGR, TJSAMP_420, TurboJPEG  # type: ignore
 
         _jpeg = TurboJPEG()
 
         def encode_jpeg(np_bgr, quality: int | None = None) -> bytes:
             q = int(quality if quality is not None else DEFAULT_JPEG_QUALITY)
-            return _jpeg.encode(np_bgr, quality=q)
+            # libjpeg-turbo reads the buffer directly; only copy strided views
+            return _jpeg.encode(
+                np.ascontiguousarray(np_bgr), quality=q, jpeg_subsample=TJSAMP_420
+            )
+
+        def decode_jpeg(data: bytes) -> np.ndarray:
+            # decode straight into BGR so callers never flip channels in Python
+            return _jpeg.decode(data, pixel_format=TJPF_BGR)
 
         encode_jpeg = profiled("enc")(encode_jpeg)
 
@@ -29,20 +38,49 @@ except Exception:  # pragma: no cover - fallback encoders
             ok, buf = cv2.imencode(".jpg", np_bgr, [int(cv2.IMWRITE_JPEG_QUALITY), q])
             return buf.tobytes() if ok else b""
 
+        def decode_jpeg(data: bytes) -> np.ndarray:
+            arr = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+            if arr is None:
+                raise ValueError("invalid JPEG data")
+            return arr
+
     except Exception:  # pragma: no cover - fallback to Pillow
         from io import BytesIO
 
-        import numpy as np
         from PIL import Image
 
         def encode_jpeg(np_bgr, quality: int | None = None) -> bytes:
             q = int(quality if quality is not None else DEFAULT_JPEG_QUALITY)
-            img = Image.fromarray(np_bgr[:, :, ::-1])
+            # unpack BGR in C instead of materialising a reversed-channel copy
+            src = np.ascontiguousarray(np_bgr)
+            h, w = src.shape[:2]
+            img = Image.frombuffer("RGB", (w, h), src, "raw", "BGR", 0, 1)
             buf = BytesIO()
             img.save(buf, format="JPEG", quality=q)
             return buf.getvalue()
 
+        def decode_jpeg(data: bytes) -> np.ndarray:
+            img = Image.open(BytesIO(data))
+            # Pillow swaps channels in C while packing the BGR buffer; copy so
+            # the result is writable like the other backends' arrays
+            raw = img.convert("RGB").tobytes("raw", "BGR")
+            return np.frombuffer(raw, np.uint8).reshape(img.size[1], img.size[0], 3).copy()
+
     encode_jpeg = profiled("enc")(encode_jpeg)
 
 
-__all__ = ["encode_jpeg"]
+_PART_HEAD = b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: "
+_PART_SEP = b"\r\n\r\n"
+_PART_TAIL = b"\r\n"
+
+
+def mjpeg_part(jpeg: bytes) -> bytes:
+    """Return ``jpeg`` framed as one ``multipart/x-mixed-replace`` part.
+
+    The part is assembled with a single ``join`` so the JPEG payload is copied
+    once instead of once per concatenation.
+    """
+    return b"".join((_PART_HEAD, b"%d" % len(jpeg), _PART_SEP, jpeg, _PART_TAIL))
+
+
+__all__ = ["decode_jpeg", "encode_jpeg", "mjpeg_part"]
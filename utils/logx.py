@@ -6,21 +6,36 @@ structured events that are also mirrored to Redis for consumption by the UI.
 
 from __future__ import annotations
 
-import json
+import atexit
+import os
+import threading
 import time
 from functools import lru_cache
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from loguru import logger
 from redis.exceptions import RedisError
 
+from . import fastjson
 from .redis import get_sync_client
-from .url import mask_credentials
+from .url import mask_creds
 
-# in-memory state for throttling helpers
+# in-memory state for throttling helpers; intervals use the monotonic clock so
+# wall-clock adjustments cannot stall or burst rate-limited logs
+_monotonic = time.monotonic
 _last_times: Dict[str, float] = {}
 _last_values: Dict[str, Any] = {}
 
+# encoded events waiting to be written to Redis in one pipeline round-trip
+_FLUSH_N = 64
+_FLUSH_INTERVAL = 0.25
+_pending: list[str | bytes] = []
+_pending_lock = threading.Lock()
+_last_flush = 0.0
+# one long-lived daemon thread flushes deferred batches; push_redis wakes it
+_flush_wakeup = threading.Event()
+_flusher: threading.Thread | None = None
+
 
 @lru_cache(maxsize=1)
 def get_redis_client():
@@ -28,27 +43,93 @@ def get_redis_client():
     return get_sync_client()
 
 
+def _resolve_level(name: str, var: str) -> int:
+    """Return the severity number for level *name*, falling back to INFO."""
+
+    try:
+        return logger.level(name.upper()).no
+    except (TypeError, ValueError):
+        logger.warning("invalid {} {!r}; using INFO", var, name)
+        return logger.level("INFO").no
+
+
+# events below this level are not mirrored to Redis
+_REDIS_MIN_NO = _resolve_level(os.getenv("LOGX_REDIS_MIN_LEVEL", "INFO"), "LOGX_REDIS_MIN_LEVEL")
+# events below this level are not written to the loguru sinks; kept in step
+# with the sink level via :func:`set_min_level`
+_log_min_no = _resolve_level(os.getenv("LOG_LEVEL", "INFO"), "LOG_LEVEL")
+
+
+def set_min_level(level: str) -> None:
+    """Skip structured events below *level* that would not reach Redis either."""
+
+    global _log_min_no
+    _log_min_no = _resolve_level(level, "log level")
+
+
+# fields that may carry stream credentials
+_MASK_KEYS = frozenset(("url", "cmd", "pipeline", "pipeline_info"))
+
 # required field map for known events
-_REQUIRED: dict[str, list[str]] = {
-    "capture_start": ["camera_id", "mode", "url"],
-    "capture_stop": ["camera_id", "mode", "url"],
-    "capture_error": ["camera_id", "mode", "url", "code", "rc", "ffmpeg_tail"],
-    "capture_read_fail": ["camera_id", "mode", "url", "status", "error", "count"],
+_REQUIRED: dict[str, frozenset[str]] = {
+    "capture_start": frozenset(("camera_id", "mode", "url")),
+    "capture_stop": frozenset(("camera_id", "mode", "url")),
+    "capture_error": frozenset(("camera_id", "mode", "url", "code", "rc", "ffmpeg_tail")),
+    "capture_read_fail": frozenset(("camera_id", "mode", "url", "status", "error", "count")),
 }
 
 
-def _validate(event: str, fields: Dict[str, Any]) -> None:
-    required = _REQUIRED.get(event)
-    if not required:
-        return
-    missing = [k for k in required if k not in fields]
-    if missing:
-        raise KeyError(f"missing fields for {event}: {', '.join(missing)}")
+def push_redis(payload: Dict[str, Any] | str | bytes) -> None:
+    """Queue *payload* for the Redis ``logs:events`` list.
 
+    *payload* may be a dict or an already JSON-encoded string or bytes.
 
-def push_redis(payload: Dict[str, Any]) -> None:
-    """Push *payload* to the Redis ``logs:events`` list."""
+    Events are written in batches through a single pipeline: immediately when
+    ``_FLUSH_N`` are pending or the previous flush is older than
+    ``_FLUSH_INTERVAL`` seconds, otherwise by a background flusher at most
+    that long after.
+    """
 
+    global _flusher
+    if isinstance(payload, (str, bytes)):
+        data = payload
+    else:
+        try:
+            data = fastjson.dumpb(payload)
+        except (TypeError, ValueError) as exc:
+            logger.warning("push_redis encode failed: {}", exc)
+            return
+    with _pending_lock:
+        _pending.append(data)
+        due = len(_pending) >= _FLUSH_N or time.monotonic() - _last_flush >= _FLUSH_INTERVAL
+        if not due:
+            if _flusher is None:
+                _flusher = threading.Thread(target=_flush_loop, name="logx-flush", daemon=True)
+                _flusher.start()
+            _flush_wakeup.set()
+    if due:
+        flush()
+
+
+def _flush_loop() -> None:
+    while True:
+        _flush_wakeup.wait()
+        # let events accumulate for one interval so they share a round trip
+        time.sleep(_FLUSH_INTERVAL)
+        flush()
+
+
+def flush() -> None:
+    """Write all pending events to Redis."""
+
+    global _last_flush
+    with _pending_lock:
+        batch = _pending[:]
+        _pending.clear()
+        _last_flush = time.monotonic()
+        _flush_wakeup.clear()
+    if not batch:
+        return
     try:
         client = get_redis_client()
     except RedisError as exc:
@@ -56,57 +137,57 @@ def push_redis(payload: Dict[str, Any]) -> None:
         get_redis_client.cache_clear()
         return
     try:
-        data = json.dumps(payload)
-    except (TypeError, ValueError) as exc:
-        logger.warning("push_redis encode failed: {}", exc)
-        return
-    try:
-        client.lpush("logs:events", data)
-        client.ltrim("logs:events", 0, 1999)
+        pipe = client.pipeline(transaction=False)
+        pipe.lpush("logs:events", *batch)
+        pipe.ltrim("logs:events", 0, 1999)
+        pipe.execute()
     except RedisError as exc:
         logger.warning("push_redis redis error: {}", exc)
         get_redis_client.cache_clear()
 
 
-def _log(level: str, event: str, **fields: Any) -> None:
-    """Internal helper to emit a structured log and mirror it to Redis."""
-
-    for key in ("url", "cmd", "pipeline", "pipeline_info"):
-        if key in fields:
-            fields[key] = mask_credentials(str(fields[key]))
-    _validate(event, fields)
-    payload: Dict[str, Any] = {
-        "ts": time.time(),
-        "level": level,
-        "event": event,
-        **fields,
-    }
-    logger.log(level.upper(), json.dumps(payload))
-    push_redis(payload)
-
-
-def event(event: str, **fields: Any) -> None:
-    """Log an informational *event* with structured *fields*."""
-
-    _log("info", event, **fields)
-
-
-def warn(event: str, **fields: Any) -> None:
-    """Log a warning *event*."""
+atexit.register(flush)
 
-    _log("warning", event, **fields)
 
+def _make_logger(level: str, name: str, doc: str) -> Callable[..., None]:
+    """Return a structured logger for *level* that mirrors events to Redis."""
 
-def error(event: str, **fields: Any) -> None:
-    """Log an error *event*."""
+    level_upper = level.upper()
+    level_no = logger.level(level_upper).no
+    to_redis = level_no >= _REDIS_MIN_NO
 
-    _log("error", event, **fields)
+    def log(event: str, **fields: Any) -> None:
+        required = _REQUIRED.get(event)
+        if required:
+            missing = required - fields.keys()
+            if missing:
+                raise KeyError(f"missing fields for {event}: {', '.join(sorted(missing))}")
+        to_sinks = level_no >= _log_min_no
+        # nothing would consume the event: skip masking and encoding entirely
+        if not (to_sinks or to_redis):
+            return
+        for key in _MASK_KEYS.intersection(fields):
+            fields[key] = mask_creds(str(fields[key]))
+        # ``**fields`` is already a fresh dict, so it doubles as the payload
+        fields["ts"] = time.time()
+        fields["level"] = level
+        fields["event"] = event
+        # encode once to bytes: Redis takes them as-is, loguru gets a decoded copy
+        data = fastjson.dumpb(fields)
+        if to_sinks:
+            logger.log(level_upper, data.decode())
+        if to_redis:
+            push_redis(data)
 
+    log.__name__ = log.__qualname__ = name
+    log.__doc__ = doc
+    return log
 
-def debug(event: str, **fields: Any) -> None:
-    """Log a debug *event*."""
 
-    _log("debug", event, **fields)
+event = _make_logger("info", "event", "Log an informational *event* with structured *fields*.")
+warn = _make_logger("warning", "warn", "Log a warning *event*.")
+error = _make_logger("error", "error", "Log an error *event*.")
+debug = _make_logger("debug", "debug", "Log a debug *event*.")
 
 
 def every(seconds: float, key: str) -> bool:
@@ -115,9 +196,9 @@ def every(seconds: float, key: str) -> bool:
     This is useful for rate-limiting noisy logs.
     """
 
-    now = time.time()
-    last = _last_times.get(key, 0)
-    if now - last >= seconds:
+    now = _monotonic()
+    last = _last_times.get(key)
+    if last is None or now - last >= seconds:
         _last_times[key] = now
         return True
     return False
@@ -151,4 +232,6 @@ __all__ = [
     "on_change",
     "log_throttled",
     "push_redis",
+    "flush",
+    "set_min_level",
 ]
@@ -0,0 +1,74 @@
+"""Bounded single-producer/single-consumer queue for pipeline hand-offs."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any
+
+
+class SPSCRing:
+    """Bounded FIFO for exactly one producer and one consumer thread.
+
+    A drop-in replacement for :class:`queue.Queue` on the tracker's hot path.
+    ``deque.append`` and ``deque.popleft`` are atomic, so items move without
+    taking a lock; a :class:`threading.Event` is only touched to wake a
+    consumer that found the ring empty. ``put`` never blocks: it raises
+    :class:`queue.Full` immediately so producers can drop frames instead of
+    stalling capture; a producer may also ``get_nowait`` to discard the oldest
+    item first. ``get`` raises :class:`queue.Empty` on timeout.
+    """
+
+    __slots__ = ("maxsize", "_buf", "_ready")
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize = maxsize
+        self._buf: deque[Any] = deque()
+        self._ready = threading.Event()
+
+    def qsize(self) -> int:
+        return len(self._buf)
+
+    def empty(self) -> bool:
+        return not self._buf
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._buf)
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None) -> None:
+        if self.full():
+            raise queue.Full
+        self._buf.append(item)
+        # the item is visible before the flag is checked, so a consumer that
+        # clears the flag afterwards still finds it on its next popleft
+        if not self._ready.is_set():
+            self._ready.set()
+
+    def put_nowait(self, item: Any) -> None:
+        self.put(item, block=False)
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        try:
+            return self._buf.popleft()
+        except IndexError:
+            if not block:
+                raise queue.Empty from None
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self._ready.clear()
+            try:
+                return self._buf.popleft()
+            except IndexError:
+                pass
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise queue.Empty
+            self._ready.wait(remaining)
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+
+__all__ = ["SPSCRing"]
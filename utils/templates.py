@@ -0,0 +1,27 @@
+"""Shared Jinja2 template environments."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from os import PathLike
+
+from fastapi.templating import Jinja2Templates
+
+
+@lru_cache(maxsize=None)
+def _templates_for(directory: str) -> Jinja2Templates:
+    templates = Jinja2Templates(directory=directory)
+    templates.env.add_extension("jinja2.ext.do")
+    return templates
+
+
+def get_templates(directory: str | PathLike[str]) -> Jinja2Templates:
+    """Return the :class:`Jinja2Templates` environment for ``directory``.
+
+    Routers initialised with the same directory share one environment, so each
+    template is loaded and compiled once per process instead of once per router.
+    """
+    return _templates_for(str(directory))
+
+
+__all__ = ["get_templates"]
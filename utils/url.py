@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from urllib.parse import quote, unquote, urlsplit, urlunsplit
 
 
@@ -70,11 +71,18 @@ _CRED_RE = re.compile(r"(?<=://)([^:@\s]+):([^@/\s]+)@")
 def mask_credentials(text: str) -> str:
     """Redact credentials in *text* for safe logging."""
 
+    if "@" not in text:
+        return text
     return _CRED_RE.sub("***:***@", text)
 
 
+@lru_cache(maxsize=4096)
 def mask_creds(url: str) -> str:
-    """Return ``url`` with password replaced by ``***`` if present."""
+    """Return ``url`` with password replaced by ``***`` if present.
+
+    Results are cached because the same camera URLs and commands are masked
+    on every log event.
+    """
 
     return mask_credentials(url)
 